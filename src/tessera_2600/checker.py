@@ -5,10 +5,18 @@ Main checker class that orchestrates service calls.
 """
 
 import logging
-from typing import List, Dict, Optional
+import threading
+from functools import lru_cache
+from typing import Any, List, Dict, Optional, Tuple
+
+import requests
 from tessera_2600.core.adapters import to_check_result
 from tessera_2600.core.models import CheckResult
-from tessera_2600.services import SERVICE_REGISTRY, SERVICE_CONFIGURATIONS, create_service, validate_services
+from tessera_2600.core.rate_limiter import RateLimiter
+from tessera_2600.core.response_cache import ResponseCache
+# Registry tables are looked up when needed so importing the checker does not load descriptors
+from tessera_2600 import services as _services
+from tessera_2600.services import create_service, validate_services
 
 logger = logging.getLogger(__name__)
 
@@ -16,10 +24,20 @@ class SocialMediaChecker:
     """Main checker class that coordinates service calls."""
     
     def __init__(self, proxy_list: Optional[List[str]] = None, timeout: int = 5, 
-                 enabled_services: Optional[List[str]] = None):
+                 enabled_services: Optional[List[str]] = None,
+                 rate_limiter: Optional[RateLimiter] = None,
+                 cache: Optional[ResponseCache] = None,
+                 max_retries: Optional[int] = None,
+                 session: Optional[requests.Session] = None):
         self.proxy_list = proxy_list or []
         self.timeout = timeout
-        self.enabled_services = enabled_services or list(SERVICE_REGISTRY.keys())
+        self.max_retries = max_retries
+        self.session = session
+        self.rate_limiter = rate_limiter
+        self.cache = cache
+        # Set by stop(); checks that have not reached the network yet are skipped
+        self._stopped = threading.Event()
+        self.enabled_services = enabled_services or list(_services.SERVICE_REGISTRY.keys())
         self.services = {}
         
         # Validate and initialize services
@@ -31,66 +49,114 @@ class SocialMediaChecker:
     
     def _initialize_services(self):
         """Initialize service instances."""
+        # Only pass optional tuning when requested so plugin services without the kwargs keep working
+        extra = {}
+        if self.max_retries is not None:
+            extra['max_retries'] = self.max_retries
+        if self.session is not None:
+            extra['session'] = self.session
         for service_key in self.enabled_services:
             try:
                 self.services[service_key] = create_service(
                     service_key, 
                     proxy_list=self.proxy_list, 
-                    timeout=self.timeout
+                    timeout=self.timeout,
+                    **extra
                 )
                 logger.debug(f"Initialized {service_key} service")
             except Exception as e:
                 logger.error(f"Failed to initialize {service_key}: {e}")
+        
+        # The service set is fixed for the checker's lifetime: bind the dispatch list once
+        self._dispatch: List[Tuple[str, Any]] = []
+        for service_key in self.enabled_services:
+            if service_key in self.services:
+                self._dispatch.append((service_key, self.services[service_key]))
+            else:
+                logger.warning(f"Service {service_key} not initialized")
     
+    def _check_service(self, service_key: str, service: Any, phone_number: str) -> CheckResult:
+        """Check phone_number against a single initialized service."""
+        try:
+            if self.cache is not None:
+                cached = self.cache.get(service_key, phone_number)
+                if cached is not None:
+                    logger.debug(f"{cached.service}: {cached.status} (cached)")
+                    return cached
+            if self.rate_limiter is not None:
+                self.rate_limiter.acquire(service_key)
+            if self._stopped.is_set():
+                return CheckResult(
+                    service=service.service_name,
+                    phone=phone_number,
+                    status="unknown",
+                    details={"cancelled": True},
+                    error="check cancelled",
+                )
+            legacy = service.check_phone_number(phone_number)
+            structured = to_check_result(service.service_name, phone_number, legacy)
+            if self.cache is not None:
+                self.cache.set(service_key, structured)
+            logger.debug(f"{service.service_name}: {structured.status}")
+            return structured
+        except Exception as e:
+            # On unexpected exception, record an error CheckResult
+            service_name = _services.SERVICE_CONFIGURATIONS[service_key]['name']
+            logger.error(f"Error checking {service_key}: {e}")
+            return CheckResult(
+                service=service_name,
+                phone=phone_number,
+                status="error",
+                details={"exception": str(e)},
+                error=str(e),
+            )
+
+    def stop(self) -> None:
+        """Stop sending requests: waiting and later checks return without contacting services."""
+        self._stopped.set()
+        if self.rate_limiter is not None:
+            self.rate_limiter.cancel()
+
     def check_phone_number(self, phone_number: str) -> Dict[str, CheckResult]:
         """Check a phone number across all configured services.
         Returns a mapping of service display name to CheckResult.
         """
         results: Dict[str, CheckResult] = {}
         
-        for service_key in self.enabled_services:
-            if service_key in self.services:
-                try:
-                    service = self.services[service_key]
-                    legacy = service.check_phone_number(phone_number)
-                    structured = to_check_result(service.service_name, phone_number, legacy)
-                    results[service.service_name] = structured
-                    logger.debug(f"{service.service_name}: {structured.status}")
-                except Exception as e:
-                    # On unexpected exception, record an error CheckResult
-                    service_name = SERVICE_CONFIGURATIONS[service_key]['name']
-                    results[service_name] = CheckResult(
-                        service=service_name,
-                        phone=phone_number,
-                        status="error",
-                        details={"exception": str(e)},
-                        error=str(e),
-                    )
-                    logger.error(f"Error checking {service_key}: {e}")
-            else:
-                logger.warning(f"Service {service_key} not initialized")
+        check = self._check_service
+        for service_key, service in self._dispatch:
+            structured = check(service_key, service, phone_number)
+            results[structured.service] = structured
         
         return results
 
 # Legacy compatibility functions
-SERVICE_RATE_LIMITS = {
-    config['name']: {
-        'recommended_delay': config['recommended_delay'],
-        'max_requests_per_minute': config['max_requests_per_minute'],
-        'description': config['description']
+@lru_cache(maxsize=None)
+def _service_rate_limits() -> Dict[str, Dict[str, Any]]:
+    return {
+        config['name']: {
+            'recommended_delay': config['recommended_delay'],
+            'max_requests_per_minute': config['max_requests_per_minute'],
+            'description': config['description']
+        }
+        for config in _services.SERVICE_CONFIGURATIONS.values()
     }
-    for config in SERVICE_CONFIGURATIONS.values()
-}
+
+def __getattr__(name):
+    # SERVICE_RATE_LIMITS is built on first access rather than at import
+    if name == 'SERVICE_RATE_LIMITS':
+        return _service_rate_limits()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 def get_recommended_timeout(enabled_services: Optional[List[str]] = None) -> int:
     """Get recommended timeout based on enabled services."""
     if not enabled_services:
-        enabled_services = list(SERVICE_REGISTRY.keys())
+        enabled_services = list(_services.SERVICE_REGISTRY.keys())
     
     max_delay = 0
     for service in enabled_services:
-        if service in SERVICE_CONFIGURATIONS:
-            delay = SERVICE_CONFIGURATIONS[service]['recommended_delay']
+        if service in _services.SERVICE_CONFIGURATIONS:
+            delay = _services.SERVICE_CONFIGURATIONS[service]['recommended_delay']
             max_delay = max(max_delay, delay)
     
     return max_delay
@@ -98,15 +164,15 @@ def get_recommended_timeout(enabled_services: Optional[List[str]] = None) -> int
 def print_rate_limit_info(enabled_services: Optional[List[str]] = None):
     """Print rate limiting information for enabled services."""
     if not enabled_services:
-        enabled_services = list(SERVICE_REGISTRY.keys())
+        enabled_services = list(_services.SERVICE_REGISTRY.keys())
     
     print("\n" + "="*60)
     print("SERVICE RATE LIMIT INFORMATION")
     print("="*60)
     
     for service in enabled_services:
-        if service in SERVICE_CONFIGURATIONS:
-            config = SERVICE_CONFIGURATIONS[service]
+        if service in _services.SERVICE_CONFIGURATIONS:
+            config = _services.SERVICE_CONFIGURATIONS[service]
             print(f"\n{config['name']}:")
             print(f"  Recommended delay: {config['recommended_delay']}s between requests")
             print(f"  Est. max requests/min: {config['max_requests_per_minute']}")
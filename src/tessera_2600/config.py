@@ -3,6 +3,7 @@
 Tessera Configuration Module
 """
 
+import os
 import logging
 
 # Application Information
@@ -25,6 +26,10 @@ CONFIRMATION_THRESHOLD = 100
 REQUEST_TIMEOUT = 15
 MAX_RETRIES = 3
 
+# Response cache (see core/response_cache.py)
+CACHE_TTL = 7 * 24 * 3600  # seconds a cached found/not_found answer stays valid
+MAX_CACHE_SIZE = 100000
+
 # Country codes and their mobile number patterns
 COUNTRY_PATTERNS = {
     '420': {  # Czech Republic
@@ -110,6 +115,13 @@ WILDCARD_PATTERN = r'[xX]'
 # Output formats
 OUTPUT_FORMATS = ['json', 'csv', 'txt']
 
+def available_cpus():
+    """CPUs this process may run on (respects affinity/cpusets where the OS exposes it)."""
+    try:
+        return max(1, len(os.sched_getaffinity(0)))
+    except (AttributeError, OSError):
+        return max(1, os.cpu_count() or 1)
+
 # Threading recommendations based on services
 def get_max_recommended_threads(enabled_services=None):
     """Get maximum recommended threads for enabled services."""
@@ -131,9 +143,9 @@ def get_max_recommended_threads(enabled_services=None):
         if not enabled_services:
             return 4  # Default
         
-        # Return the most conservative recommendation
+        # Return the most conservative recommendation, never more than 2 threads per usable CPU
         min_threads = min(thread_limits.get(service, 8) for service in enabled_services)
-        return max(1, min_threads)
+        return max(1, min(min_threads, available_cpus() * 2))
         
     except ImportError:
         # Fallback if services module not available
@@ -8,33 +8,74 @@ from __future__ import annotations
 import re
 import time
 import logging
+import threading
+from functools import lru_cache
 from typing import Any, Dict, Optional
 import os
 
 import requests
+from requests.adapters import HTTPAdapter, DEFAULT_POOLSIZE
 import importlib
 
 from tessera_2600.core.descriptor_models import ServiceDescriptor, Endpoint
 from tessera_2600.core.proxy_manager import ProxyManager
-from tessera_2600.config import CONFIRMATION_THRESHOLD, REQUEST_TIMEOUT
+from tessera_2600.config import CONFIRMATION_THRESHOLD, REQUEST_TIMEOUT, MAX_RETRIES
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+    "Accept": "application/json, text/plain, */*",
+    "Accept-Language": "en-US,en;q=0.9",
+    "Accept-Encoding": "gzip, deflate, br",
+    "DNT": "1",
+    "Connection": "keep-alive",
+    "Sec-Fetch-Dest": "empty",
+    "Sec-Fetch-Mode": "cors",
+    "Sec-Fetch-Site": "same-origin",
+}
+
+
+@lru_cache(maxsize=256)
+def _compile_signal(pattern: str) -> "re.Pattern":
+    """Compile a descriptor regex signal once instead of on every response."""
+    return re.compile(pattern)
+
+
+def create_session(pool_size: int = 0) -> requests.Session:
+    """Build a keep-alive Session with the default headers.
+
+    Pass the result to several services/checkers to share connections between them.
+    pool_size > 0 sizes the per-host connection pool, one slot per concurrent worker.
+    """
+    session = requests.Session()
+    session.headers.update(DEFAULT_HEADERS)
+    if pool_size > 0:
+        # pool_connections is the number of per-host pools kept; pool_maxsize is connections per host
+        adapter = HTTPAdapter(pool_connections=max(DEFAULT_POOLSIZE, pool_size), pool_maxsize=pool_size)
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+    return session
+
 
 class DeclarativeService:
     """Runtime for descriptor-defined services (no BaseService dependency)."""
 
-    def __init__(self, descriptor: ServiceDescriptor, proxy_list=None, timeout: int = 5):
+    def __init__(self, descriptor: ServiceDescriptor, proxy_list=None, timeout: int = 5,
+                 max_retries: int = MAX_RETRIES, session: Optional[requests.Session] = None):
         self.descriptor = descriptor
         self.proxy_list = list(proxy_list or [])
         self._proxy_manager: Optional[ProxyManager] = (
             ProxyManager(self.proxy_list) if self.proxy_list else None
         )
-        self._last_proxy_url: Optional[str] = None
-
-        # Session and timeouts
-        self.session = requests.Session()
-        self._setup_session()
+        # Proxy used by the current request, kept per thread since one instance may serve several workers
+        self._local = threading.local()
+        # Transport failures are retried on the next proxy, but only when there is one to rotate to
+        self.max_retries = max(0, int(max_retries)) if len(self.proxy_list) > 1 else 0
+
+        # Session (shared if provided; one instance may serve several worker threads) and timeouts.
+        # Callers running several workers size the pool via create_session(pool_size=...).
+        self.session = session if session is not None else create_session()
         effective_timeout = int(descriptor.timeouts.get("request", timeout or REQUEST_TIMEOUT))
         self.timeout = max(effective_timeout, 1)
 
@@ -53,20 +94,13 @@ class DeclarativeService:
         return int(self.descriptor.recommended_delay or 2)
 
     # --- Session / Proxy helpers (inline, replacing BaseService bits) ---
-    def _setup_session(self):
-        self.session.headers.update(
-            {
-                "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
-                "Accept": "application/json, text/plain, */*",
-                "Accept-Language": "en-US,en;q=0.9",
-                "Accept-Encoding": "gzip, deflate, br",
-                "DNT": "1",
-                "Connection": "keep-alive",
-                "Sec-Fetch-Dest": "empty",
-                "Sec-Fetch-Mode": "cors",
-                "Sec-Fetch-Site": "same-origin",
-            }
-        )
+    @property
+    def _last_proxy_url(self) -> Optional[str]:
+        return getattr(self._local, 'proxy_url', None)
+
+    @_last_proxy_url.setter
+    def _last_proxy_url(self, proxy_url: Optional[str]) -> None:
+        self._local.proxy_url = proxy_url
 
     def _get_proxy(self) -> Optional[Dict[str, str]]:
         if self._proxy_manager:
@@ -113,36 +147,31 @@ class DeclarativeService:
 
     def _evaluate_signals(self, ep: Endpoint, resp: requests.Response) -> float:
         score = 0.0
-        text = resp.text or ""
-        try:
-            data = resp.json()
-        except Exception:
-            data = None
-
-        def add_if(cond: bool, weight: float, sign: int = 1):
-            nonlocal score
-            if cond:
-                score += sign * (weight * 100.0)  # scale to 0..100
-
-        for s in ep.success_signals:
-            if s.type == "status" and s.equals is not None:
-                add_if(str(resp.status_code) == str(s.equals), s.weight)
-            elif s.type == "json_path" and data is not None and s.path and s.equals is not None:
-                key = s.path.lstrip("$.")
-                if isinstance(data, dict):
-                    add_if(data.get(key) == s.equals, s.weight)
-            elif s.type == "regex" and s.pattern:
-                add_if(re.search(s.pattern, text) is not None, s.weight)
-
-        for s in ep.failure_signals:
-            if s.type == "status" and s.equals is not None:
-                add_if(str(resp.status_code) == str(s.equals), s.weight, sign=-1)
-            elif s.type == "json_path" and data is not None and s.path and s.equals is not None:
-                key = s.path.lstrip("$.")
-                if isinstance(data, dict):
-                    add_if(data.get(key) == s.equals, s.weight, sign=-1)
-            elif s.type == "regex" and s.pattern:
-                add_if(re.search(s.pattern, text) is not None, s.weight, sign=-1)
+        # Decode/parse the body lazily: only when a regex or JSON signal needs it, and at most once
+        text: Optional[str] = None
+        data: Any = None
+        parsed = False
+
+        for signals, sign in ((ep.success_signals, 1), (ep.failure_signals, -1)):
+            for s in signals:
+                if s.type == "status" and s.equals is not None:
+                    hit = str(resp.status_code) == str(s.equals)
+                elif s.type == "json_path" and s.path and s.equals is not None:
+                    if not parsed:
+                        try:
+                            data = resp.json()
+                        except Exception:
+                            data = None
+                        parsed = True
+                    hit = isinstance(data, dict) and data.get(s.path.lstrip("$.")) == s.equals
+                elif s.type == "regex" and s.pattern:
+                    if text is None:
+                        text = resp.text or ""
+                    hit = _compile_signal(s.pattern).search(text) is not None
+                else:
+                    continue
+                if hit:
+                    score += sign * (s.weight * 100.0)  # scale to 0..100
 
         return score
 
@@ -154,6 +183,7 @@ class DeclarativeService:
 
         for ep in self.descriptor.endpoints:
             tries = 0
+            failovers = 0
             while True:
                 tries += 1
                 # Render URL, headers, body
@@ -189,29 +219,35 @@ class DeclarativeService:
                     last_status = resp.status_code
                     score = self._evaluate_signals(ep, resp)
                     confidence += score
-                    try:
-                        preview = (resp.text or "")[:200].replace("\n", " ")
-                    except Exception:
-                        preview = "<no preview>"
-                    line = (
-                        f"Descriptor {self.descriptor.service_key}/{ep.name}: "
-                        f"status={last_status}, score_add={score}, total_conf={confidence}, preview={preview!r}"
-                    )
-                    logger.info(line)
                     # Optional hard print for environments where logging is captured/hidden
-                    if os.environ.get("TESSERA_DEBUG_REQUESTS") == "1":
+                    debug_print = os.environ.get("TESSERA_DEBUG_REQUESTS") == "1"
+                    if debug_print or logger.isEnabledFor(logging.INFO):
                         try:
-                            print(line, flush=True)
+                            preview = (resp.text or "")[:200].replace("\n", " ")
                         except Exception:
-                            pass
-                except requests.exceptions.Timeout:
-                    self._report_error()
-                    return "[ERROR]: Request timeout"
-                except requests.exceptions.ProxyError:
-                    self._report_error()
-                    return "[ERROR]: Proxy connection failed"
-                except requests.exceptions.ConnectionError:
+                            preview = "<no preview>"
+                        line = (
+                            f"Descriptor {self.descriptor.service_key}/{ep.name}: "
+                            f"status={last_status}, score_add={score}, total_conf={confidence}, preview={preview!r}"
+                        )
+                        logger.info(line)
+                        if debug_print:
+                            try:
+                                print(line, flush=True)
+                            except Exception:
+                                pass
+                except (requests.exceptions.Timeout, requests.exceptions.ConnectionError) as e:
+                    # ProxyError is a ConnectionError subclass; both are checked before the generic case
                     self._report_error()
+                    if failovers < self.max_retries:
+                        failovers += 1
+                        tries -= 1  # failovers don't consume the endpoint's status retry budget
+                        logger.debug(f"Transport error via {self._last_proxy_url}, failing over ({failovers}/{self.max_retries}): {e}")
+                        continue
+                    if isinstance(e, requests.exceptions.Timeout):
+                        return "[ERROR]: Request timeout"
+                    if isinstance(e, requests.exceptions.ProxyError):
+                        return "[ERROR]: Proxy connection failed"
                     return "[ERROR]: Connection failed"
                 except Exception as e:
                     self._report_error()
@@ -7,10 +7,15 @@ from __future__ import annotations
 
 from dataclasses import dataclass, asdict
 from typing import Any, Dict, Literal, Optional
+import sys
 import time
 
 Status = Literal["found", "not_found", "error", "rate_limited", "invalid", "unknown"]
 
+# Keyword arguments for @dataclass that add __slots__ where supported (Python 3.10+);
+# older interpreters get regular dataclasses. Usage: @dataclass(**DATACLASS_SLOTS)
+DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
 
 @dataclass(frozen=True)
 class CheckResult:
@@ -25,6 +30,32 @@ class CheckResult:
         return asdict(self)
 
 
+@dataclass(**DATACLASS_SLOTS)
+class FoundAccount:
+    """A found hit collected during a run (number as checked, service display name)."""
+    number: str
+    platform: str
+    status: str
+    details: Dict[str, Any]
+    timestamp: float
+    index: int
+    worker_id: Optional[int] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Dict form used in result files; worker_id is included only when set."""
+        data = {
+            'number': self.number,
+            'platform': self.platform,
+            'status': self.status,
+            'details': self.details,
+            'timestamp': self.timestamp,
+            'index': self.index,
+        }
+        if self.worker_id is not None:
+            data['worker_id'] = self.worker_id
+        return data
+
+
 @dataclass
 class RunSummary:
     run_id: str
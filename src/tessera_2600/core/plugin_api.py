@@ -26,7 +26,7 @@ from tessera_2600.core.adapters import to_check_result
 from tessera_2600.core.models import CheckResult
 
 # Bump when programmatic surface changes (additive, backward compatible)
-PLUGIN_API_VERSION = "1.1"
+PLUGIN_API_VERSION = "1.2"
 
 
 def discover_service_plugins() -> Dict[str, Type]:
@@ -164,6 +164,15 @@ def create_service_instance(service_key: str, proxy_list: Optional[List[str]] =
     raise ValueError(f"Unknown service '{service_key}'.")
 
 
+def validate_phones(phones: Iterable[str]) -> List[bool]:
+    """Validate phone number formats in bulk; returns one bool per input, in order.
+
+    Useful as a preflight before iter_check() on large inputs.
+    """
+    from tessera_2600.utils import validate_phone_number_batch
+    return validate_phone_number_batch(phones)
+
+
 def check_phone(service_key: str, phone: str, proxy_list: Optional[List[str]] = None, timeout: int = 5) -> CheckResult:
     """Check a single phone with a single service and return a CheckResult."""
     svc = create_service_instance(service_key, proxy_list=proxy_list, timeout=timeout)
@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+"""
+Rate Limiter Module
+Thread-safe per-service request pacing.
+"""
+
+import time
+import threading
+import logging
+from typing import Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+class RateLimiter:
+    """Thread-safe pacer enforcing a minimum interval between requests per key.
+
+    Each key (service) keeps its own schedule. acquire() reserves the next free
+    slot for that key under the lock and sleeps outside of it, so concurrent
+    workers are spread out over time instead of bursting. cancel() wakes every
+    sleeping worker at once so a stopped run does not wait out booked slots.
+    """
+
+    def __init__(self, intervals: Optional[Dict[str, float]] = None, default_interval: float = 0.0):
+        self.intervals = {key: max(0.0, float(v)) for key, v in (intervals or {}).items()}
+        self.default_interval = max(0.0, float(default_interval))
+        self._next_slot: Dict[str, float] = {}
+        self.lock = threading.Lock()
+        self._cancelled = threading.Event()
+
+    def interval_for(self, key: str) -> float:
+        """Minimum number of seconds between two requests for key."""
+        return self.intervals.get(key, self.default_interval)
+
+    def acquire(self, key: str) -> float:
+        """Block until a request for key may be sent. Returns the time waited."""
+        interval = self.interval_for(key)
+        if interval <= 0 or self._cancelled.is_set():
+            return 0.0
+
+        with self.lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot.get(key, now))
+            self._next_slot[key] = slot + interval
+
+        delay = slot - now
+        if delay > 0:
+            self._cancelled.wait(delay)
+        return delay
+
+    def cancel(self) -> None:
+        """Wake all workers waiting in acquire(); later calls return without waiting."""
+        self._cancelled.set()
@@ -0,0 +1,182 @@
+#!/usr/bin/env python3
+"""
+Response Cache Module
+Persistent sqlite-backed LRU cache of per-service check results.
+"""
+
+import os
+import json
+import time
+import sqlite3
+import threading
+import logging
+from typing import Dict, Optional, Tuple
+
+from tessera_2600.core.models import CheckResult
+from tessera_2600.config import CACHE_TTL, MAX_CACHE_SIZE
+
+logger = logging.getLogger(__name__)
+
+# Only definitive answers are worth reusing; errors and rate limits are transient
+CACHEABLE_STATUSES = frozenset(("found", "not_found"))
+
+# Commit batched changes (writes, expirations, access times) and evict once per this many
+_FLUSH_EVERY = 256
+
+
+def default_cache_path() -> str:
+    """Location of the response cache ($XDG_CACHE_HOME/tessera/responses.db)."""
+    base = os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+    return os.path.join(base, 'tessera', 'responses.db')
+
+
+def _normalize_number(number: str) -> str:
+    """Reduce a formatted number to +<digits> so equivalent spellings share an entry."""
+    return '+' + ''.join(ch for ch in number if ch.isdigit())
+
+
+class ResponseCache:
+    """Thread-safe LRU cache of CheckResults keyed by (service key, number).
+
+    Changes are committed in batches rather than per call, and access times of
+    hits are kept in memory until the next batch, so workers spend as little
+    time as possible behind the lock. An interrupted run loses at most one batch.
+    """
+
+    def __init__(self, path: Optional[str] = None, ttl: float = CACHE_TTL, max_size: int = MAX_CACHE_SIZE):
+        self.path = path or default_cache_path()
+        self.ttl = ttl
+        self.max_size = max_size
+        self.lock = threading.Lock()
+        self._pending = 0
+        self._touched: Dict[Tuple[str, str], float] = {}
+        self._closed = False
+
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        # WAL with NORMAL sync avoids a synchronous fsync per commit; losing the tail is harmless for a cache
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            " service TEXT NOT NULL,"
+            " number TEXT NOT NULL,"
+            " payload TEXT NOT NULL,"
+            " stored REAL NOT NULL,"
+            " accessed REAL NOT NULL,"
+            " PRIMARY KEY (service, number))"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS responses_accessed ON responses (accessed)")
+        self._conn.commit()
+
+    def get(self, service_key: str, number: str) -> Optional[CheckResult]:
+        """Return the cached result for number on service_key, or None on miss/expiry.
+
+        Hits carry details['cached'] = True and the original check time in details['checked_at'].
+        """
+        key = (service_key, _normalize_number(number))
+        now = time.time()
+        with self.lock:
+            # Workers still finishing a request after a stopped run may call in after close()
+            if self._closed:
+                return None
+            row = self._conn.execute(
+                "SELECT payload, stored FROM responses WHERE service = ? AND number = ?", key
+            ).fetchone()
+            if row is None:
+                return None
+            payload, stored = row
+            if self.ttl and now - stored > self.ttl:
+                self._conn.execute("DELETE FROM responses WHERE service = ? AND number = ?", key)
+                self._touched.pop(key, None)
+                self._note_change(now)
+                return None
+            self._touched[key] = now
+            self._note_change(now)
+        try:
+            data = json.loads(payload)
+            data['phone'] = number
+            # Flag the reused answer and keep when it was really checked; ts is this lookup
+            data['details'] = dict(data.get('details') or {}, cached=True, checked_at=data.get('ts'))
+            data['ts'] = now
+            return CheckResult(**data)
+        except Exception as e:
+            logger.debug(f"Discarding unreadable cache entry for {service_key}: {e}")
+            return None
+
+    def set(self, service_key: str, result: CheckResult) -> None:
+        """Store result if its status is definitive; other statuses are ignored."""
+        if result.status not in CACHEABLE_STATUSES:
+            return
+        now = time.time()
+        payload = json.dumps(result.to_dict(), default=str)
+        with self.lock:
+            if self._closed:
+                return
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses (service, number, payload, stored, accessed)"
+                " VALUES (?, ?, ?, ?, ?)",
+                (service_key, _normalize_number(result.phone), payload, now, now),
+            )
+            self._note_change(now)
+
+    def _note_change(self, now: float) -> None:
+        """Count an uncommitted change and flush once a batch is full. Caller holds the lock."""
+        self._pending += 1
+        if self._pending >= _FLUSH_EVERY:
+            self._flush(now)
+
+    def _flush(self, now: float) -> None:
+        """Record access times, evict and commit the batch. Caller holds the lock."""
+        if self._touched:
+            self._conn.executemany(
+                "UPDATE responses SET accessed = ? WHERE service = ? AND number = ?",
+                [(accessed,) + key for key, accessed in self._touched.items()],
+            )
+            self._touched.clear()
+        self._evict(now)
+        self._conn.commit()
+        self._pending = 0
+
+    def _evict(self, now: float) -> None:
+        """Drop expired rows, then the least recently used ones beyond max_size. Caller holds the lock."""
+        if self.ttl:
+            self._conn.execute("DELETE FROM responses WHERE stored < ?", (now - self.ttl,))
+        (count,) = self._conn.execute("SELECT COUNT(*) FROM responses").fetchone()
+        excess = count - self.max_size
+        if excess > 0:
+            self._conn.execute(
+                "DELETE FROM responses WHERE rowid IN"
+                " (SELECT rowid FROM responses ORDER BY accessed LIMIT ?)",
+                (excess,),
+            )
+
+    def cleanup(self) -> None:
+        """Apply TTL and size limits immediately."""
+        with self.lock:
+            self._flush(time.time())
+
+    def __len__(self) -> int:
+        with self.lock:
+            return self._conn.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+
+    def clear(self) -> None:
+        """Remove every cached response."""
+        with self.lock:
+            self._conn.execute("DELETE FROM responses")
+            self._touched.clear()
+            self._conn.commit()
+            self._pending = 0
+
+    def close(self) -> None:
+        """Commit the pending batch, apply eviction and close the database."""
+        with self.lock:
+            if self._closed:
+                return
+            self._closed = True
+            try:
+                self._flush(time.time())
+            finally:
+                self._conn.close()
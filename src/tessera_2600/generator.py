@@ -7,11 +7,20 @@ Enhanced with country-specific default prefixes.
 
 import re
 import logging
-from typing import List, Optional, Tuple
+from itertools import product
+from typing import Iterator, List, Optional, Tuple
 from tessera_2600.config import MAX_WILDCARDS, COUNTRY_PATTERNS, PHONE_PATTERN
 
 logger = logging.getLogger(__name__)
 
+# Compiled once at import; used by pattern validation and parsing
+COMPILED_PATTERNS = {
+    'PHONE': re.compile(PHONE_PATTERN, re.IGNORECASE),
+    # Everything except digits, '+' and wildcards (drops spaces, dashes, brackets and stray chars)
+    'NON_PATTERN_CHARS': re.compile(r'[^\d+xX]'),
+    'WILDCARD': re.compile(r'[xX]'),
+}
+
 class PhoneNumberGenerator:
     """Generate all possible variations of a partial phone number with wildcards."""
     
@@ -24,9 +33,8 @@ class PhoneNumberGenerator:
     
     def _parse_phone_number(self):
         """Parse phone number to extract country code and base number."""
-        # Remove all non-digit characters except + and x
-        cleaned = re.sub(r'[^\d+xX\s\-\(\)]', '', self.partial_number)
-        cleaned = re.sub(r'[^\d+xX]', '', cleaned)  # Remove spaces, dashes, brackets
+        # Keep only digits, + and x (removes spaces, dashes, brackets and anything else)
+        cleaned = COMPILED_PATTERNS['NON_PATTERN_CHARS'].sub('', self.partial_number)
         
         # Extract country code
         if cleaned.startswith('+'):
@@ -66,10 +74,26 @@ class PhoneNumberGenerator:
         else:
             return self._generate_standard()
     
+    def iter_variations(self) -> Iterator[str]:
+        """Lazily yield the same variations, in the same order, as generate_variations()."""
+        for pattern in self._expansion_patterns():
+            yield from self._expand(pattern)
+    
+    def count_variations(self) -> int:
+        """Number of variations generate_variations() would produce, without expanding them."""
+        return sum(10 ** pattern.lower().count('x') for pattern in self._expansion_patterns())
+    
+    def _expansion_patterns(self) -> List[str]:
+        """Patterns to expand: the input itself, or one per valid country prefix."""
+        if not self.should_use_country_prefixes():
+            return [self.partial_number]
+        prefixes = COUNTRY_PATTERNS[self.country_code]['prefixes']
+        # Replace the first (unknown) digit with each valid prefix
+        return [f"+{self.country_code}{prefix}{self.base_number[1:]}" for prefix in prefixes]
+    
     def _generate_standard(self) -> List[str]:
         """Standard generation method (original behavior)."""
-        variations = []
-        self._generate_helper(self.partial_number, variations)
+        variations = list(self._expand(self.partial_number))
         logger.info(f"Generated {len(variations)} variations for pattern: {self.partial_number}")
         return variations
     
@@ -81,14 +105,9 @@ class PhoneNumberGenerator:
         logger.info(f"Using country prefixes for {country_info['name']} (+{self.country_code})")
         logger.info(f"Valid mobile prefixes: {', '.join(country_info['prefixes'])}")
         
-        # For each valid prefix, replace the first 'x' and generate variations
-        for prefix in country_info['prefixes']:
-            # Create pattern with country code + prefix + remaining pattern
-            pattern_with_prefix = f"+{self.country_code}{prefix}{self.base_number[1:]}"
-            
-            # Generate all variations for this prefix
-            variations = []
-            self._generate_helper(pattern_with_prefix, variations)
+        # For each valid prefix, generate variations of country code + prefix + remaining pattern
+        for prefix, pattern_with_prefix in zip(country_info['prefixes'], self._expansion_patterns()):
+            variations = list(self._expand(pattern_with_prefix))
             all_variations.extend(variations)
             
             logger.debug(f"Generated {len(variations)} variations for prefix {prefix}")
@@ -96,21 +115,22 @@ class PhoneNumberGenerator:
         logger.info(f"Generated {len(all_variations)} total variations using country prefixes")
         return all_variations
     
-    def _generate_helper(self, current: str, variations: List[str]):
-        """Recursive helper to generate variations."""
-        if 'x' not in current.lower():
-            variations.append(current)
+    @staticmethod
+    def _expand(pattern: str) -> Iterator[str]:
+        """Yield pattern with every 'x' replaced by digits, first wildcard most significant."""
+        # Turn the pattern into a format template with one field per wildcard
+        template = COMPILED_PATTERNS['WILDCARD'].sub('{}', pattern.replace('{', '{{').replace('}', '}}'))
+        wildcards = pattern.lower().count('x')
+        if not wildcards:
+            yield pattern
             return
-        
-        # Find first 'x' (case insensitive)
-        index = current.lower().index('x')
-        for digit in range(10):
-            new_number = current[:index] + str(digit) + current[index + 1:]
-            self._generate_helper(new_number, variations)
+        fill = template.format
+        for digits in product('0123456789', repeat=wildcards):
+            yield fill(*digits)
 
 def validate_phone_number(phone_number: str) -> bool:
     """Validate phone number pattern using config.PHONE_PATTERN."""
-    return bool(re.match(PHONE_PATTERN, phone_number, re.IGNORECASE))
+    return COMPILED_PATTERNS['PHONE'].match(phone_number) is not None
 
 def validate_pattern(pattern: str) -> bool:
     """Validate that the pattern contains wildcards and is properly formatted."""
@@ -118,13 +138,15 @@ def validate_pattern(pattern: str) -> bool:
         logger.error(f"Invalid phone number format: {pattern}")
         return False
     
+    # Count wildcards once with C-level str.count (no lowered copy of the pattern)
+    wildcard_count = pattern.count('x') + pattern.count('X')
+    
     # Must contain at least one wildcard
-    if 'x' not in pattern.lower():
+    if not wildcard_count:
         logger.warning("Pattern should contain at least one 'x' wildcard")
         return False
     
     # Check for reasonable number of wildcards (to prevent excessive generation)
-    wildcard_count = pattern.lower().count('x')
     if wildcard_count > MAX_WILDCARDS:
         logger.error(f"Too many wildcards ({wildcard_count}). Maximum {MAX_WILDCARDS} allowed to prevent excessive generation.")
         return False
@@ -149,4 +171,9 @@ def can_use_country_prefixes(pattern: str) -> Tuple[bool, Optional[str], Optiona
 def expand_phone_number(pattern: str, use_country_prefixes: bool = False) -> List[str]:
     """Generate all variations of a phone number pattern."""
     generator = PhoneNumberGenerator(pattern, use_country_prefixes)
-    return generator.generate_variations()
\ No newline at end of file
+    return generator.generate_variations()
+
+def iter_phone_numbers(pattern: str, use_country_prefixes: bool = False) -> Tuple[Iterator[str], int]:
+    """Lazily generate the variations of a pattern; returns (iterator, total count)."""
+    generator = PhoneNumberGenerator(pattern, use_country_prefixes)
+    return generator.iter_variations(), generator.count_variations()
\ No newline at end of file
@@ -7,23 +7,100 @@ Handles saving and managing results from phone number checks.
 import os
 import json
 import time
+import queue
 import logging
-from typing import List, Dict, Optional, Any
-from tessera_2600.core.models import CheckResult
+import threading
+from typing import List, Dict, Optional, Any, Union
+from tessera_2600.core.models import CheckResult, FoundAccount
+
+# Optional fast JSON encoder for the JSONL stream; stdlib json is used otherwise
+try:
+    import orjson  # type: ignore
+except Exception:  # pragma: no cover - optional dependency
+    orjson = None  # type: ignore
 
 logger = logging.getLogger(__name__)
 
+
+def _account_dict(account: Union[FoundAccount, Dict[str, Any]]) -> Dict[str, Any]:
+    """Accept FoundAccount records as well as legacy/loaded account dicts."""
+    if isinstance(account, FoundAccount):
+        return account.to_dict()
+    return account
+
+
+def _jsonl_line(obj: Dict[str, Any]) -> bytes:
+    """Serialize one JSONL record (including the trailing newline) to bytes."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_APPEND_NEWLINE)
+    return (json.dumps(obj) + '\n').encode('utf-8')
+
+
+class JsonlWriter:
+    """Append CheckResults to a JSONL file from a dedicated background thread.
+
+    write() only enqueues; serialization and disk I/O happen on the writer
+    thread. The queue is bounded, so a stalled disk applies backpressure
+    instead of growing memory. The file is flushed whenever the queue runs
+    empty, so an interrupted run keeps every record written so far. close()
+    drains the queue, closes the file and joins the thread.
+    """
+
+    _SENTINEL = object()
+
+    def __init__(self, filepath: str, maxsize: int = 1000):
+        self.filepath = filepath
+        os.makedirs(os.path.dirname(filepath) or '.', exist_ok=True)
+        # Opened here so a bad path fails in the caller rather than silently in the thread
+        self._fh = open(filepath, 'ab', buffering=1 << 16)
+        self._queue: queue.Queue = queue.Queue(maxsize=maxsize)
+        self._thread = threading.Thread(target=self._run, name='jsonl-writer', daemon=True)
+        self._thread.start()
+
+    def write(self, result: CheckResult) -> None:
+        self._queue.put(result)
+
+    def _run(self) -> None:
+        failed = False
+        try:
+            while True:
+                item = self._queue.get()
+                if item is self._SENTINEL:
+                    break
+                try:
+                    self._fh.write(_jsonl_line(item.to_dict()))
+                    # Batch writes during bursts, but never leave caught-up records in the buffer
+                    if self._queue.empty():
+                        self._fh.flush()
+                except Exception as e:
+                    if not failed:
+                        logger.warning(f"Failed to write JSONL record to {self.filepath}: {e}")
+                        failed = True
+        finally:
+            try:
+                self._fh.close()
+            except OSError as e:
+                logger.warning(f"Failed to close JSONL stream {self.filepath}: {e}")
+
+    def close(self) -> None:
+        """Flush pending records and stop the writer thread."""
+        if self._thread.is_alive():
+            self._queue.put(self._SENTINEL)
+            self._thread.join()
+
+
 class ResultsHandler:
     """Handles saving and managing results from phone number checks (CLI-only)."""
     
     def __init__(self):
         pass
     
-    def save_results(self, found_accounts: List[Dict[str, Any]], output_file: str, *, output_format: Optional[str] = None, number_format: str = 'local') -> bool:
+    def save_results(self, found_accounts: List[Union[FoundAccount, Dict[str, Any]]], output_file: str, *, output_format: Optional[str] = None, number_format: str = 'local') -> bool:
         """Save aggregated results to file with conflict handling and multiple formats.
         Only 'found' accounts are expected in found_accounts.
-        Each item should include: number, platform, status, details, timestamp, index.
+        Each item is a FoundAccount or a dict with: number, platform, status, details, timestamp, index.
         """
+        found_accounts = [_account_dict(a) for a in found_accounts]
         if not output_file or not found_accounts:
             if not found_accounts:
                 print("No accounts to save.")
@@ -166,17 +243,19 @@ class ResultsHandler:
         import csv
         fieldnames = ['number', 'platform', 'status', 'timestamp', 'index']
         with open(filepath, 'w', newline='', encoding='utf-8') as f:
-            writer = csv.DictWriter(f, fieldnames=fieldnames)
-            writer.writeheader()
-            for a in accounts:
-                row = {
-                    'number': a.get('number', ''),
-                    'platform': a.get('platform', ''),
-                    'status': a.get('status') or a.get('result', ''),
-                    'timestamp': a.get('timestamp', ''),
-                    'index': a.get('index', ''),
-                }
-                writer.writerow(row)
+            # Plain writer with rows in fieldnames order; writerows drives the generator in C
+            writer = csv.writer(f)
+            writer.writerow(fieldnames)
+            writer.writerows(
+                (
+                    a.get('number', ''),
+                    a.get('platform', ''),
+                    a.get('status') or a.get('result', ''),
+                    a.get('timestamp', ''),
+                    a.get('index', ''),
+                )
+                for a in accounts
+            )
     
     def _write_txt(self, filepath: str, accounts: List[Dict[str, Any]]):
         with open(filepath, 'w', encoding='utf-8') as f:
@@ -205,17 +284,19 @@ class ResultsHandler:
         return formatted
 
     def append_jsonl(self, filepath: str, result: CheckResult) -> None:
-        """Append a single CheckResult as JSONL line for durability."""
+        """Append a single CheckResult as JSONL line for durability.
+
+        Opens the file per call; use JsonlWriter to stream many records.
+        """
         os.makedirs(os.path.dirname(filepath) or '.', exist_ok=True)
-        with open(filepath, 'a', encoding='utf-8') as f:
-            json.dump(result.to_dict(), f)
-            f.write('\n')
+        with open(filepath, 'ab') as f:
+            f.write(_jsonl_line(result.to_dict()))
     
     # -----------------
     # Per-service saves
     # -----------------
     def save_per_service_results(self,
-                                 found_accounts: List[Dict[str, Any]],
+                                 found_accounts: List[Union[FoundAccount, Dict[str, Any]]],
                                  out_dir: str,
                                  *,
                                  output_format: Optional[str] = None,
@@ -238,7 +319,7 @@ class ResultsHandler:
 
         # Group by platform
         by_platform: Dict[str, List[Dict[str, Any]]] = {}
-        for a in found_accounts:
+        for a in map(_account_dict, found_accounts):
             p = a.get('platform') or 'unknown'
             by_platform.setdefault(p, []).append(a)
 
@@ -282,23 +363,18 @@ class ResultsHandler:
         """Merge new results with existing results."""
         existing_accounts = existing_data.get('accounts', [])
         
-        existing_numbers = set()
-        for account in existing_accounts:
-            number = account.get('number', '')
-            platform = account.get('platform', '')
-            existing_numbers.add(f"{number}:{platform}")
-        
-        added_count = 0
-        for account in new_accounts:
-            number = account.get('number', '')
-            platform = account.get('platform', '')
-            key = f"{number}:{platform}"
-            
-            if key not in existing_numbers:
-                existing_accounts.append(account)
-                existing_numbers.add(key)
-                added_count += 1
-        
+        existing_keys = {f"{a.get('number', '')}:{a.get('platform', '')}" for a in existing_accounts}
+        to_add = []
+        for a in new_accounts:
+            key = f"{a.get('number', '')}:{a.get('platform', '')}"
+            # Also skips repeats within new_accounts
+            if key in existing_keys:
+                continue
+            existing_keys.add(key)
+            to_add.append(a)
+        existing_accounts.extend(to_add)
+        added_count = len(to_add)
+
         merged_data = {
             'timestamp': time.time(),
             'last_merge': time.time(),
@@ -479,13 +555,16 @@ class ResultsHandler:
     def _generate_new_filename(self, original_filepath: str) -> str:
         """Generate a new filename by adding a number suffix."""
         base_path, ext = os.path.splitext(original_filepath)
-        counter = 1
-        
-        while True:
-            new_path = f"{base_path}_{counter}{ext}"
-            if not os.path.exists(new_path):
-                return new_path
-            counter += 1
-            
-            if counter > 1000:
-                raise ValueError("Could not generate unique filename after 1000 attempts")
\ No newline at end of file
+        base = os.path.basename(base_path)
+        # Read the directory once instead of probing each candidate with os.path.exists
+        try:
+            with os.scandir(os.path.dirname(original_filepath) or '.') as it:
+                taken = {entry.name for entry in it}
+        except OSError:
+            taken = set()
+
+        for counter in range(1, 1001):
+            if f"{base}_{counter}{ext}" not in taken:
+                return f"{base_path}_{counter}{ext}"
+
+        raise ValueError("Could not generate unique filename after 1000 attempts")
@@ -5,18 +5,27 @@ Handles phone number variation generation and validation.
 """
 
 import logging
-from typing import List, Tuple
-from tessera_2600.generator import expand_phone_number, can_use_country_prefixes
+from functools import lru_cache
+from itertools import islice
+from typing import Iterator, List, Optional, Tuple
+from tessera_2600.generator import iter_phone_numbers, can_use_country_prefixes
 from tessera_2600.config import SUCCESS_MESSAGES, ERROR_MESSAGES, COUNTRY_PATTERNS
 
 logger = logging.getLogger(__name__)
 
+
+@lru_cache(maxsize=1024)
+def _can_use_prefixes_cached(pattern: str) -> Tuple[bool, Optional[str], Optional[str]]:
+    """Memoized can_use_country_prefixes; the result depends only on the pattern."""
+    return can_use_country_prefixes(pattern)
+
+
 class VariationGenerator:
     """Handles phone number variation generation and validation without UI side-effects."""
     
     def suggest_country_prefixes(self, pattern: str) -> bool:
         """Return True if pattern can benefit from country prefixes (no UI here)."""
-        can_use, country_code, country_name = can_use_country_prefixes(pattern)
+        can_use, country_code, country_name = _can_use_prefixes_cached(pattern)
         return bool(can_use)
     
     def generate_variations(self, pattern: str, max_variations: int, use_country_prefixes: bool = False,
@@ -24,30 +33,38 @@ class VariationGenerator:
         """Generate phone number variations with validation and optional start position.
         Pure function: no printing/UI.
         """
+        work_iter, count = self.iter_variations(pattern, max_variations, use_country_prefixes, start_index)
+        if not count:
+            return [], 0
+        return list(work_iter), start_index
+    
+    def iter_variations(self, pattern: str, max_variations: int, use_country_prefixes: bool = False,
+                        start_index: int = 0) -> Tuple[Iterator[Tuple[int, str]], int]:
+        """Lazy counterpart of generate_variations().
+        Returns (work item iterator, number of work items); the count is computed
+        analytically so nothing is expanded up front. Refused runs yield nothing and count 0.
+        """
         if use_country_prefixes:
-            can_use, _, _ = can_use_country_prefixes(pattern)
+            can_use, _, _ = _can_use_prefixes_cached(pattern)
             if not can_use:
                 use_country_prefixes = False
         
         try:
-            all_numbers = expand_phone_number(pattern, use_country_prefixes)
+            all_numbers, total_variations = iter_phone_numbers(pattern, use_country_prefixes)
         except Exception:
-            return [], 0
-        
-        total_variations = len(all_numbers)
+            return iter(()), 0
         
         if total_variations == 0:
-            return [], 0
+            return iter(()), 0
         
         if start_index >= total_variations:
-            return [], 0
+            return iter(()), 0
         
-        # Create work items with indices
-        work_items = []
-        for i, number in enumerate(all_numbers[start_index:], start_index + 1):
-            work_items.append((i, number))
+        # Refuse oversized runs
+        if total_variations - start_index > max_variations:
+            return iter(()), 0
         
-        if len(work_items) > max_variations:
-            return [], 0
+        # Work items with 1-based indices, skipping to the start position
+        work_items = enumerate(islice(all_numbers, start_index, None), start_index + 1)
         
-        return work_items, start_index
\ No newline at end of file
+        return work_items, total_variations - start_index
\ No newline at end of file
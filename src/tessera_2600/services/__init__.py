@@ -15,15 +15,21 @@ Descriptor source resolution rules when duplicates exist (same basename):
 - YAML files are only considered if PyYAML is installed.
 - When multiple files exist for the same basename, a warning is logged and the
   selected file path is recorded for display in the CLI.
+
+Descriptors are loaded lazily on first use (registry access or any lookup
+helper below) so importing the package stays cheap.
 """
 
 from tessera_2600.core.declarative_service import DeclarativeService
 from tessera_2600.core.descriptor_models import from_dict as descriptor_from_dict, ServiceDescriptor
+from tessera_2600.core.models import DATACLASS_SLOTS
 import os
 import json
-from typing import Optional
+from dataclasses import dataclass
+from typing import Any, Dict, Optional, Tuple
 import re
 import logging
+import threading
 
 # Optional YAML support for descriptors (.yaml/.yml)
 try:
@@ -31,82 +37,133 @@ try:
 except Exception:  # pragma: no cover - optional dependency
     yaml = None  # type: ignore
 
-# Service registry for easy access. Everything is dynamic via descriptors only.
-SERVICE_REGISTRY = {}
-
-# Service metadata/configurations (populated dynamically from descriptors)
-SERVICE_CONFIGURATIONS = {}
-
-# Selected descriptors (after resolving duplicates)
-DESCRIPTOR_REGISTRY = {}
-
-# Track descriptor source paths and duplicates for transparency in CLI
-DESCRIPTOR_SOURCES = {}
-_DUPLICATE_WARNINGS = []
+# Optional fast JSON parser; stdlib json is used when it is not installed
+try:
+    import orjson  # type: ignore
+except Exception:  # pragma: no cover - optional dependency
+    orjson = None  # type: ignore
 
 logger = logging.getLogger(__name__)
-try:
-    # Collect descriptor search directories: package defaults plus any extras from env
-    _desc_dir = os.path.join(os.path.dirname(__file__), 'descriptors')
-    _search_dirs = []
-    if os.path.isdir(_desc_dir):
-        _search_dirs.append(_desc_dir)
+
+# Registries below are populated lazily: descriptors are discovered and parsed on
+# first access (module attribute lookup or any helper in this module), not at
+# package import. Names listed here are served through the module __getattr__.
+_LAZY_NAMES = frozenset({
+    # Service registry for easy access. Everything is dynamic via descriptors only.
+    'SERVICE_REGISTRY',
+    # Service metadata/configurations (populated dynamically from descriptors)
+    'SERVICE_CONFIGURATIONS',
+    # Selected descriptors (after resolving duplicates)
+    'DESCRIPTOR_REGISTRY',
+    # Track descriptor source paths and duplicates for transparency in CLI
+    'DESCRIPTOR_SOURCES',
+    '_DUPLICATE_WARNINGS',
+    '_NAME_INDEX',
+})
+_LOAD_LOCK = threading.Lock()
+_LOADED = False
+
+
+@dataclass(frozen=True, **DATACLASS_SLOTS)
+class DescriptorSource:
+    """Where a descriptor-backed service was loaded from (see get_descriptor_source)."""
+    selected_path: str
+    selected_file: str
+    candidates: Tuple[str, ...]
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'selected_path': self.selected_path,
+            'selected_file': self.selected_file,
+            'candidates': list(self.candidates),
+        }
+
+
+def _descriptor_search_dirs():
+    """Collect descriptor search directories: package defaults plus any extras from env."""
+    search_dirs = []
+    desc_dir = os.path.join(os.path.dirname(__file__), 'descriptors')
+    if os.path.isdir(desc_dir):
+        search_dirs.append(desc_dir)
     # Allow injecting additional descriptor directories via env (path-separated)
     # e.g., TESSERA_EXTRA_DESCRIPTOR_DIRS="/path/to/repo/src/tessera_2600/services/descriptors"
-    _extra = os.environ.get('TESSERA_EXTRA_DESCRIPTOR_DIRS') or os.environ.get('TESSERA_DESCRIPTOR_DIRS')
-    if _extra:
-        for d in _extra.split(os.path.pathsep):
+    extra = os.environ.get('TESSERA_EXTRA_DESCRIPTOR_DIRS') or os.environ.get('TESSERA_DESCRIPTOR_DIRS')
+    if extra:
+        for d in extra.split(os.path.pathsep):
             d = d.strip()
             if d and os.path.isdir(d):
-                _search_dirs.append(d)
+                search_dirs.append(d)
+    return search_dirs
+
 
-    if _search_dirs:
+def _parse_descriptor(path: str) -> Optional[ServiceDescriptor]:
+    try:
+        if path.endswith('.json'):
+            if orjson is not None:
+                with open(path, 'rb') as fh:
+                    data = orjson.loads(fh.read())
+            else:
+                with open(path, 'r', encoding='utf-8') as fh:
+                    data = json.load(fh)
+        elif (path.endswith('.yaml') or path.endswith('.yml')) and yaml is not None:
+            with open(path, 'r', encoding='utf-8') as fh:
+                data = yaml.safe_load(fh)
+        else:
+            return None
+        if type(data) is not dict:
+            logger.warning(f"Descriptor file is not a mapping: {os.path.basename(path)}")
+            return None
+        return descriptor_from_dict(data)
+    except Exception as e:
+        # Make descriptor loading failures visible to help diagnose why a service is missing
+        logger.warning(f"Failed to parse descriptor '{os.path.basename(path)}': {e}")
+        return None
+
+
+def _load_descriptors():
+    """Discover, select and parse descriptors.
+
+    Returns (service_registry, service_configurations, descriptor_registry,
+    descriptor_sources, duplicate_warnings).
+    """
+    service_registry = {}
+    service_configurations = {}
+    descriptor_registry = {}
+    descriptor_sources = {}
+    duplicate_warnings = []
+    try:
+        search_dirs = _descriptor_search_dirs()
         # Group files by base name to detect duplicates regardless of YAML availability
         groups = {}
-        for d in _search_dirs:
-            try:
-                files = [f for f in os.listdir(d) if f.lower().endswith(('.json', '.yaml', '.yml'))]
-            except Exception:
-                files = []
-            for fname in files:
-                base, ext = os.path.splitext(fname)
-                groups.setdefault(base, []).append((os.path.join(d, fname), ext.lower()))
-
-        def _parse_descriptor(path: str) -> Optional[ServiceDescriptor]:
+        for d in search_dirs:
+            # Single scandir pass: DirEntry carries the file type, so no extra stat per file
             try:
-                if path.endswith('.json'):
-                    with open(path, 'r', encoding='utf-8') as fh:
-                        data = json.load(fh)
-                elif (path.endswith('.yaml') or path.endswith('.yml')) and yaml is not None:
-                    with open(path, 'r', encoding='utf-8') as fh:
-                        data = yaml.safe_load(fh)
-                else:
-                    return None
-                if not isinstance(data, dict):
-                    logger.warning(f"Descriptor file is not a mapping: {os.path.basename(path)}")
-                    return None
-                return descriptor_from_dict(data)
-            except Exception as e:
-                # Make descriptor loading failures visible to help diagnose why a service is missing
-                logger.warning(f"Failed to parse descriptor '{os.path.basename(path)}': {e}")
-                return None
+                with os.scandir(d) as it:
+                    for entry in it:
+                        name = entry.name
+                        dot = name.rfind('.')
+                        if dot <= 0:
+                            continue
+                        ext = name[dot:].lower()
+                        if ext not in ('.json', '.yaml', '.yml') or not entry.is_file():
+                            continue
+                        groups.setdefault(name[:dot], []).append((entry.path, ext))
+            except OSError:
+                continue
 
         # Resolve per-group selection with priority: .json > .yaml/.yml
         for base, abs_candidates in groups.items():
-            
+
             # Prefer JSON
             json_candidates = [p for p, ext in abs_candidates if ext == '.json']
             yaml_candidates = [p for p, ext in abs_candidates if ext in ('.yaml', '.yml')]
 
             selected_path: Optional[str] = None
-            considered = []
 
             if json_candidates:
                 selected_path = sorted(json_candidates)[0]
-                considered = sorted([os.path.basename(p) for p in json_candidates + yaml_candidates])
             elif yaml is not None and yaml_candidates:
                 selected_path = sorted(yaml_candidates)[0]
-                considered = sorted([os.path.basename(p) for p in yaml_candidates])
             else:
                 # Only YAML present but PyYAML not installed; skip with notice
                 if yaml_candidates:
@@ -114,7 +171,7 @@ try:
                         f"Descriptor '{base}' has only YAML candidates but PyYAML is not installed; "
                         f"files ignored: {', '.join(sorted(os.path.basename(p) for p in yaml_candidates))}"
                     )
-                    _DUPLICATE_WARNINGS.append(warning)
+                    duplicate_warnings.append(warning)
                     logger.warning(warning)
                 continue
 
@@ -124,7 +181,7 @@ try:
                     f"Multiple descriptor files for service '{base}': {', '.join(sorted(os.path.basename(p) for p, _ in abs_candidates))}. "
                     f"Selected '{os.path.basename(selected_path)}' (JSON preferred)."
                 )
-                _DUPLICATE_WARNINGS.append(warning)
+                duplicate_warnings.append(warning)
                 logger.warning(warning)
 
             # Parse the selected descriptor
@@ -133,18 +190,18 @@ try:
                 continue
 
             key = desc.service_key
-            DESCRIPTOR_REGISTRY[key] = desc
-            DESCRIPTOR_SOURCES[key] = {
-                'selected_path': selected_path,
-                'selected_file': os.path.basename(selected_path),
-                'candidates': [p for p, _ in abs_candidates],
-            }
+            descriptor_registry[key] = desc
+            descriptor_sources[key] = DescriptorSource(
+                selected_path=selected_path,
+                selected_file=os.path.basename(selected_path),
+                candidates=tuple(p for p, _ in abs_candidates),
+            )
 
             # Expose every descriptor as a service
-            if key not in SERVICE_REGISTRY:
-                SERVICE_REGISTRY[key] = DeclarativeService  # factory will pass descriptor
+            if key not in service_registry:
+                service_registry[key] = DeclarativeService  # factory will pass descriptor
                 # Add minimal configuration for CLI/help surfaces
-                SERVICE_CONFIGURATIONS[key] = {
+                service_configurations[key] = {
                     'name': desc.display_name,
                     'description': desc.description or 'Declarative service',
                     'country': 'Global',
@@ -160,16 +217,48 @@ try:
                     'descriptor_file': os.path.basename(selected_path),
                     'descriptor_path': selected_path,
                 }
-except Exception:
-    # Descriptor loading is optional; ignore failures entirely
-    DESCRIPTOR_REGISTRY = {}
+    except Exception:
+        # Descriptor loading is optional; ignore failures entirely
+        descriptor_registry = {}
+    return service_registry, service_configurations, descriptor_registry, descriptor_sources, duplicate_warnings
+
+
+def _ensure_loaded():
+    """Load descriptors once, on first use."""
+    global SERVICE_REGISTRY, SERVICE_CONFIGURATIONS, DESCRIPTOR_REGISTRY, DESCRIPTOR_SOURCES
+    global _DUPLICATE_WARNINGS, _NAME_INDEX, _LOADED
+    if _LOADED:
+        return
+    with _LOAD_LOCK:
+        if _LOADED:
+            return
+        (SERVICE_REGISTRY, SERVICE_CONFIGURATIONS, DESCRIPTOR_REGISTRY,
+         DESCRIPTOR_SOURCES, _DUPLICATE_WARNINGS) = _load_descriptors()
+        _NAME_INDEX = _build_name_index()
+        _LOADED = True
+
+
+def __getattr__(name):
+    if name in _LAZY_NAMES:
+        _ensure_loaded()
+        return globals()[name]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 # --- Flexible name handling -------------------------------------------------
 
+# Deletes every ASCII character outside [a-z0-9] (input is lower-cased first)
+_NORMALIZE_TABLE = str.maketrans('', '', ''.join(
+    chr(c) for c in range(128) if not ('a' <= chr(c) <= 'z' or '0' <= chr(c) <= '9')
+))
+_NON_ALNUM_RE = re.compile(r"[^a-z0-9]")
+
+
 def _normalize_name(name: str) -> str:
     """Normalize user-provided service names for flexible matching."""
-    return re.sub(r"[^a-z0-9]", "", name.lower())
+    normalized = name.lower().translate(_NORMALIZE_TABLE)
+    # The table only covers ASCII; anything left over goes through the regex
+    return normalized if normalized.isascii() else _NON_ALNUM_RE.sub("", normalized)
 
 
 def _build_name_index():
@@ -200,15 +289,13 @@ def _build_name_index():
     return index
 
 
-_NAME_INDEX = _build_name_index()
-
-
 def resolve_service_key(name_or_key: str) -> Optional[str]:
     """Resolve a user-provided service identifier to a canonical key."""
     if not name_or_key:
         return None
-    # Fast path exact match
-    if name_or_key in SERVICE_REGISTRY:
+    _ensure_loaded()
+    # Fast path exact match: one hash lookup (registry values are service classes)
+    if SERVICE_REGISTRY.get(name_or_key) is not None:
         return name_or_key
     return _NAME_INDEX.get(_normalize_name(name_or_key))
 
@@ -217,6 +304,7 @@ def create_service(service_key, *args, **kwargs):
 
     Instantiates DeclarativeService and passes the loaded ServiceDescriptor.
     """
+    _ensure_loaded()
     # Allow flexible identifiers
     canonical = resolve_service_key(service_key) or service_key
     service_cls = SERVICE_REGISTRY.get(canonical)
@@ -233,6 +321,7 @@ def validate_services(service_list=None):
     Validate service list and return valid services.
     If no list provided, returns all available services.
     """
+    _ensure_loaded()
     if service_list is None:
         return list(SERVICE_REGISTRY.keys())
     
@@ -248,29 +337,34 @@ def validate_services(service_list=None):
 
 def get_service_info(service_key):
     """Get configuration info for a service (accepts aliases)."""
+    _ensure_loaded()
     canonical = resolve_service_key(service_key) or service_key
     return SERVICE_CONFIGURATIONS.get(canonical)
 
 def get_descriptor_source(service_key):
     """Return descriptor source information for a given service key (accepts aliases).
 
-    Returns a dict like:
-    {
-        'selected_path': '/abs/path/services/descriptors/seznamcz.json',
-        'selected_file': 'seznamcz.json',
-        'candidates': ['/abs/.../seznamcz.json', '/abs/.../seznamcz.yaml']
-    }
+    Returns a DescriptorSource like:
+    DescriptorSource(
+        selected_path='/abs/path/services/descriptors/seznamcz.json',
+        selected_file='seznamcz.json',
+        candidates=('/abs/.../seznamcz.json', '/abs/.../seznamcz.yaml'),
+    )
     or None if not a descriptor-backed service or info unavailable.
+    Use DescriptorSource.to_dict() where the previous dict shape is needed.
     """
+    _ensure_loaded()
     canonical = resolve_service_key(service_key) or service_key
     return DESCRIPTOR_SOURCES.get(canonical)
 
 def get_duplicate_warnings():
     """Expose any duplicate/selection warnings captured during descriptor loading."""
+    _ensure_loaded()
     return list(_DUPLICATE_WARNINGS)
 
 def get_proxy_required_services(service_list=None):
     """Get list of services that require proxies."""
+    _ensure_loaded()
     services_to_check = service_list or SERVICE_REGISTRY.keys()
     # Normalize any provided identifiers
     services_to_check = [resolve_service_key(s) or s for s in services_to_check]
@@ -281,6 +375,7 @@ def get_proxy_required_services(service_list=None):
 
 def get_max_recommended_delay(service_list=None):
     """Get maximum recommended delay for a list of services."""
+    _ensure_loaded()
     services_to_check = service_list or SERVICE_REGISTRY.keys()
     services_to_check = [resolve_service_key(s) or s for s in services_to_check]
     max_delay = 0
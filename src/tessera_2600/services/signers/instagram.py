@@ -1,12 +1,24 @@
 #!/usr/bin/env python3
 import hmac
 import hashlib
-import urllib.parse
 import json
 import re
 
 # https://github.com/yazeed44/social-media-detector-api/blob/master/yocial/features/Instagram/Instagram.py
 IG_SIG_KEY = 'e6358aeede676184b9fe702b30f4fd35e71744605e39d2181a34cede076b3c33'
+_IG_SIG_KEY_BYTES = IG_SIG_KEY.encode('utf-8')
+
+# Byte -> quoted text lookup reproducing urllib.parse.quote_plus (safe='')
+_QUOTE_SAFE = frozenset(b'ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789_.-~')
+_QUOTE_TABLE = tuple(
+    chr(b) if b in _QUOTE_SAFE else ('+' if b == 0x20 else '%{:02X}'.format(b))
+    for b in range(256)
+)
+
+
+def _quote_plus_bytes(data: bytes) -> str:
+    """Percent-encode bytes for a form body; equivalent to quote_plus."""
+    return ''.join(map(_QUOTE_TABLE.__getitem__, data))
 
 
 def ig_sig_v4(headers, query, body, context, **kwargs):
@@ -38,10 +50,12 @@ def ig_sig_v4(headers, query, body, context, **kwargs):
     composed['q'] = q_value
 
     # Build JSON payload exactly like typical Python default dumps
-    # (matches the reference implementation which does not tweak separators/ensure_ascii)
-    payload = json.dumps(composed)
-    signature = hmac.new(IG_SIG_KEY.encode('utf-8'), payload.encode('utf-8'), hashlib.sha256).hexdigest()
-    signed_body = f"{signature}.{urllib.parse.quote_plus(payload)}"
+    # (matches the reference implementation which does not tweak separators/ensure_ascii).
+    # orjson is not an option here: its compact separators would change the signed bytes.
+    # Encode once and reuse the bytes for both the HMAC and the percent-encoding.
+    payload = json.dumps(composed).encode('utf-8')
+    signature = hmac.new(_IG_SIG_KEY_BYTES, payload, hashlib.sha256).hexdigest()
+    signed_body = f"{signature}.{_quote_plus_bytes(payload)}"
 
     # Build the exact form body string to avoid double-encoding by requests
     version = str((body or {}).get('ig_sig_key_version', '4'))
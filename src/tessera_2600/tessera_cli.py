@@ -9,7 +9,22 @@ import os
 import sys
 import logging
 import time
-from typing import List, Dict, Tuple, Optional
+from collections import namedtuple
+from contextlib import ExitStack
+from functools import lru_cache
+from itertools import chain
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from typing import Iterable, List, Dict, Tuple, Optional
+
+# Raw single-key input is only available on POSIX terminals
+try:
+    import termios
+    import tty
+    _HAS_POSIX_TTY = True
+except ImportError:  # pragma: no cover - Windows
+    termios = None  # type: ignore
+    tty = None  # type: ignore
+    _HAS_POSIX_TTY = False
 
 # Ensure local source package is importable when running this file directly or as a script
 try:  # pragma: no cover - runtime convenience for direct script execution
@@ -24,22 +39,25 @@ except Exception:
 # Import core modules (use absolute package imports for PyPI compatibility)
 from tessera_2600.generator import expand_phone_number, validate_pattern, can_use_country_prefixes
 from tessera_2600.checker import SocialMediaChecker
+from tessera_2600.core.rate_limiter import RateLimiter
+from tessera_2600.core.response_cache import ResponseCache
+from tessera_2600.core.declarative_service import create_session
+from tessera_2600.core.models import FoundAccount
 from tessera_2600.services import (
-    SERVICE_CONFIGURATIONS,
     validate_services,
     get_descriptor_source,
     get_duplicate_warnings,
 )
-from tessera_2600.utils import load_proxies, confirm_action, format_phone_number
+from tessera_2600.utils import load_proxies, confirm_action, format_phone_number, ProgressLogFilter
 from tessera_2600.config import (
     APP_NAME, APP_VERSION, APP_DESCRIPTION, DEFAULT_TIMEOUT, DEFAULT_MAX_VARIATIONS,
-    DEFAULT_PAUSE_ON_FOUND, DEFAULT_AUTO_CONTINUE, CONFIRMATION_THRESHOLD,
+    DEFAULT_PAUSE_ON_FOUND, DEFAULT_AUTO_CONTINUE, CONFIRMATION_THRESHOLD, MAX_RETRIES,
     ERROR_MESSAGES, SUCCESS_MESSAGES, COUNTRY_PATTERNS
 )
 
 # Import operations
 from tessera_2600.operations.variation_generator import VariationGenerator
-from tessera_2600.operations.results_handler import ResultsHandler
+from tessera_2600.operations.results_handler import ResultsHandler, JsonlWriter
 from rich.console import Console
 from rich.logging import RichHandler
 from rich.table import Table
@@ -48,7 +66,87 @@ from rich import box
 from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TimeElapsedColumn, TimeRemainingColumn
 
 
-console = Console()
+def _make_console() -> Console:
+    """Console for stdout. When output is piped or redirected, skip colour and highlighting work."""
+    if sys.stdout.isatty():
+        return Console()
+    # Markup stays enabled so tags are stripped rather than printed literally
+    return Console(highlight=False, no_color=True)
+
+
+console = _make_console()
+
+
+def _boxed(text: str, **panel_kwargs):
+    """Panel.fit on a terminal; plain text (with an optional 'Title: ' prefix) otherwise."""
+    if console.is_terminal:
+        return Panel.fit(text, **panel_kwargs)
+    title = panel_kwargs.get('title')
+    return f"{title}: {text}" if title else text
+
+
+# Display-ready per-service fields, flattened from SERVICE_CONFIGURATIONS
+ServiceRow = namedtuple('ServiceRow', 'name delay proxy_rec severity descriptor_file description max_rpm')
+
+
+@lru_cache(maxsize=None)
+def _service_table() -> Dict[str, ServiceRow]:
+    """Built on first use, so importing the CLI does not load the service descriptors."""
+    from tessera_2600.services import SERVICE_CONFIGURATIONS
+    table = {}
+    for service_key, config in SERVICE_CONFIGURATIONS.items():
+        table[service_key] = ServiceRow(
+            name=config['name'],
+            delay=config.get('recommended_delay', ''),
+            proxy_rec=bool(config.get('proxy_recommended', config.get('requires_proxy', False))),
+            severity=(config.get('rate_limit_severity') or 'unknown').capitalize(),
+            descriptor_file=config.get('descriptor_file', '') or '',
+            description=config.get('description', ''),
+            max_rpm=config.get('max_requests_per_minute', ''),
+        )
+    return table
+
+
+def _proxy_recommended(names: List[str]) -> List[str]:
+    """Selected services whose descriptors recommend running behind proxies."""
+    table = _service_table()
+    return [name for name in names if name in table and table[name].proxy_rec]
+
+
+@lru_cache(maxsize=1024)
+def _fmt_ts(ts: int) -> str:
+    """Format a whole-second timestamp; hits found within the same second share the result."""
+    return time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(ts))
+
+
+def _when(account: FoundAccount) -> str:
+    """When the account was checked; answers reused from the cache show their original check time."""
+    if account.details.get('cached'):
+        return f"{_fmt_ts(int(account.details.get('checked_at') or account.timestamp))} (cached)"
+    return _fmt_ts(int(account.timestamp))
+
+
+@lru_cache(maxsize=None)
+def _descriptor_source(service_key: str):
+    """Memoized get_descriptor_source(); descriptor selection is fixed once services are loaded."""
+    return get_descriptor_source(service_key)
+
+
+@lru_cache(maxsize=128)
+def _estimate(services: frozenset, n: int, timeout: Optional[float]) -> Tuple[float, float]:
+    """(low, high) duration estimate in seconds for checking n variations against services."""
+    from tessera_2600.config import get_recommended_timeout_for_services
+    svc_count = max(1, len(services))
+    rec_delay = get_recommended_timeout_for_services(list(services))
+    # Optimistic: very fast endpoints like Seznam can be ~50–70 ms per variation when timeout is 0
+    optimistic_per_var = max(0.05, float(timeout)) if timeout is not None else 0.05
+    # If we know services have non-zero recommended delay, use it as conservative bound
+    if rec_delay and rec_delay > 0:
+        conservative_per_var = float(rec_delay)
+    else:
+        # Otherwise assume a small per-service overhead (≈60 ms each)
+        conservative_per_var = max(optimistic_per_var, 0.06 * svc_count)
+    return n * optimistic_per_var, n * conservative_per_var
 
 
 class ConsoleUI:
@@ -56,7 +154,7 @@ class ConsoleUI:
 
     @staticmethod
     def print_banner():
-        console.print(Panel.fit(f"[bold cyan]{APP_NAME}[/] CLI v{APP_VERSION}\n[dim]{APP_DESCRIPTION}[/]", border_style="cyan"))
+        console.print(_boxed(f"[bold cyan]{APP_NAME}[/] CLI v{APP_VERSION}\n[dim]{APP_DESCRIPTION}[/]", border_style="cyan"))
 
     @staticmethod
     def print_service_info(services: List[str]):
@@ -68,25 +166,22 @@ class ConsoleUI:
         table.add_column("Descriptor")
         table.add_column("Notes", overflow="fold")
         for service_key in services:
-            if service_key in SERVICE_CONFIGURATIONS:
-                config = SERVICE_CONFIGURATIONS[service_key]
-                proxy_recommended = config.get('proxy_recommended', config.get('requires_proxy', False))
-                proxy_req = "Recommended" if proxy_recommended else "Optional"
-                severity = (config.get('rate_limit_severity', 'unknown') or 'unknown').capitalize()
+            row = _service_table().get(service_key)
+            if row is not None:
                 # Resolve descriptor (filename with extension) if available
                 src = None
                 try:
-                    src = get_descriptor_source(service_key)
+                    src = _descriptor_source(service_key)
                 except Exception:
                     src = None
-                descriptor_file = (src or {}).get('selected_file') or config.get('descriptor_file', '') or ''
+                descriptor_file = (src.selected_file if src else '') or row.descriptor_file
                 table.add_row(
-                    config['name'],
-                    str(config['recommended_delay']),
-                    proxy_req,
-                    severity,
+                    row.name,
+                    str(row.delay),
+                    "Recommended" if row.proxy_rec else "Optional",
+                    row.severity,
                     descriptor_file,
-                    config.get('description', '')
+                    row.description
                 )
         console.print(table)
 
@@ -94,18 +189,18 @@ class ConsoleUI:
     def _get_single_key() -> str:
         """Read a single key without requiring Enter. Falls back to input()."""
         try:
-            # POSIX
-            import sys as _sys
-            import termios as _termios
-            import tty as _tty
-            fd = _sys.stdin.fileno()
-            old = _termios.tcgetattr(fd)
+            # POSIX: the terminal state is read per call since it can change between prompts
+            if not _HAS_POSIX_TTY:
+                raise OSError("termios unavailable")
+            fd = sys.stdin.fileno()
+            old = termios.tcgetattr(fd)
             try:
-                _tty.setraw(fd)
-                ch = _sys.stdin.read(1)
+                tty.setraw(fd)
+                # Read straight from the fd so no keystrokes are left in sys.stdin's buffer
+                ch = os.read(fd, 1)
             finally:
-                _termios.tcsetattr(fd, _termios.TCSADRAIN, old)
-            return ch
+                termios.tcsetattr(fd, termios.TCSADRAIN, old)
+            return ch.decode('utf-8', errors='ignore')
         except Exception:
             try:
                 # Windows
@@ -136,9 +231,9 @@ class ConsoleUI:
             return 'stop'
 
     @staticmethod
-    def print_summary(found_accounts: List[Dict], total_checked: int, elapsed_time: int):
+    def print_summary(found_accounts: List[FoundAccount], total_checked: int, elapsed_time: int):
         from tessera_2600.utils import format_duration
-        console.print(Panel.fit(
+        console.print(_boxed(
             f"Checked: [bold]{total_checked:,}[/] | Found: [bold green]{len(found_accounts)}[/] | Elapsed: [bold]{format_duration(elapsed_time)}[/]",
             title="Summary",
             border_style="green",
@@ -151,114 +246,198 @@ class ConsoleUI:
             table.add_column("Status")
             table.add_column("When")
             for i, acc in enumerate(found_accounts, 1):
-                when = time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(acc.get('timestamp', time.time())))
-                table.add_row(str(i), acc.get('number', ''), acc.get('platform', ''), acc.get('status', ''), when)
+                table.add_row(str(i), acc.number, acc.platform, acc.status, _when(acc))
             console.print(table)
 
 
 class CLIChecker:
     """Main checker for CLI version with Rich feedback."""
 
-    def __init__(self, services: List[str], proxies: List[str], timeout: int, jsonl_out: Optional[str] = None):
+    def __init__(self, services: List[str], proxies: List[str], timeout: int, jsonl_out: Optional[str] = None,
+                 threads: int = 1, use_cache: bool = True, max_retries: int = MAX_RETRIES):
         self.services = services
         self.proxies = proxies
         self.timeout = timeout
+        self.threads = max(1, int(threads or 1))
+        self.use_cache = use_cache
+        self.max_retries = max_retries
         self.ui = ConsoleUI()
-        self.found_accounts: List[Dict] = []
+        self.found_accounts: List[FoundAccount] = []
         self.jsonl_out = jsonl_out
         self.found_count = 0
 
-    def run_checks(self, work_items: List[Tuple[int, str]], pause_on_found: bool,
-                   auto_continue: bool) -> Tuple[List[Dict], int]:
-        total_variations = len(work_items)
-        auto_continue_enabled = auto_continue
-
-        checker = SocialMediaChecker(
-            proxy_list=self.proxies,
-            timeout=self.timeout,
-            enabled_services=self.services
-        )
+    def _build_rate_limiter(self) -> RateLimiter:
+        """Pace each service independently at the configured delay between requests."""
+        return RateLimiter({service_key: self.timeout for service_key in self.services})
 
-        console.print(f"\n[bold]Starting checks[/] with {len(self.proxies)} proxies, timeout {self.timeout}s")
-        console.print(f"Services: [cyan]{', '.join(self.services)}[/]")
-        if pause_on_found and not auto_continue_enabled:
-            console.print("Pause-on-found: [yellow]ENABLED[/]")
-        elif auto_continue_enabled:
-            console.print("Auto-continue: [green]ENABLED[/]")
+    def _open_cache(self) -> Optional[ResponseCache]:
+        """Open the persistent response cache; run uncached if it is disabled or unavailable."""
+        if not self.use_cache:
+            return None
+        try:
+            return ResponseCache()
+        except Exception as e:
+            console.print(f"[yellow]Response cache unavailable, continuing without it:[/] {e}")
+            return None
 
-        from tessera_2600.operations.results_handler import ResultsHandler
-        rh = ResultsHandler()
+    @staticmethod
+    def _stop_workers(checker: SocialMediaChecker, executor: ThreadPoolExecutor, pending: Dict) -> None:
+        """Stop a run without waiting out rate-limit delays.
 
+        Queued checks are cancelled, workers sleeping on a booked slot wake up and
+        skip their request, and requests already on the wire finish in the background.
+        """
+        checker.stop()
+        for future in pending:
+            future.cancel()
+        executor.shutdown(wait=False)
+
+    def run_checks(self, work_items: Iterable[Tuple[int, str]], pause_on_found: bool,
+                   auto_continue: bool, total: Optional[int] = None) -> Tuple[List[FoundAccount], int]:
+        """Check work items (any iterable); pass total when work_items has no len()."""
+        total_variations = total if total is not None else len(work_items)
+        auto_continue_enabled = auto_continue
+        items = iter(work_items)
+        pending: Dict = {}
+        window = self.threads * 2
+        i = 0
+
+        def submit_next() -> bool:
+            item = next(items, None)
+            if item is None:
+                return False
+            pending[executor.submit(checker.check_phone_number, item[1])] = item
+            return True
+
+        log_filter = ProgressLogFilter()
         try:
-            # Temporarily suppress INFO/DEBUG logs so they don't break the live progress area
-            prev_disabled = logging.root.manager.disable
-            logging.disable(logging.INFO)
-
-            # Include a running found counter in the task description; avoid per-hit prints in auto-continue
-            with Progress(
-                SpinnerColumn(),
-                TextColumn("{task.description}"),
-                BarColumn(),
-                TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
-                TimeElapsedColumn(),
-                TimeRemainingColumn(),
-                transient=True,
-                refresh_per_second=10,
-                console=console,
-                disable=not console.is_terminal,
-            ) as progress:
-                task = progress.add_task("Checking variations • Found: 0", total=total_variations)
-                for i, (idx, number) in enumerate(work_items, 1):
-                    try:
-                        results = checker.check_phone_number(number)
+            # Everything opened below is released in reverse order; each step runs
+            # even if an earlier one fails or is interrupted by another Ctrl-C.
+            with ExitStack() as cleanup:
+                # Stream all results if requested; records are written off the main thread
+                jsonl_writer = JsonlWriter(self.jsonl_out) if self.jsonl_out else None
+                if jsonl_writer is not None:
+                    cleanup.callback(jsonl_writer.close)
+                cache = self._open_cache()
+                if cache is not None:
+                    cleanup.callback(cache.close)
+                # One keep-alive session for every service, with a connection slot per worker
+                session = create_session(pool_size=self.threads)
+                cleanup.callback(session.close)
+
+                checker = SocialMediaChecker(
+                    proxy_list=self.proxies,
+                    timeout=self.timeout,
+                    enabled_services=self.services,
+                    rate_limiter=self._build_rate_limiter(),
+                    cache=cache,
+                    max_retries=self.max_retries,
+                    session=session,
+                )
+
+                console.print(f"\n[bold]Starting checks[/] with {len(self.proxies)} proxies, timeout {self.timeout}s")
+                console.print(f"Services: [cyan]{', '.join(self.services)}[/]")
+                if pause_on_found and not auto_continue_enabled:
+                    console.print("Pause-on-found: [yellow]ENABLED[/]")
+                elif auto_continue_enabled:
+                    console.print("Auto-continue: [green]ENABLED[/]")
+
+                # Bounded submission window: workers never run far ahead of the consumer,
+                # so stopping on a found account leaves little in-flight work behind.
+                executor = ThreadPoolExecutor(max_workers=self.threads)
+                cleanup.callback(self._stop_workers, checker, executor, pending)
+
+                # Temporarily hide INFO/DEBUG records so they don't break the live progress area
+                log_filter.attach()
+                cleanup.callback(log_filter.detach)
+
+                # Include a running found counter in the task description; avoid per-hit prints in auto-continue
+                with Progress(
+                    SpinnerColumn(),
+                    TextColumn("{task.description}"),
+                    BarColumn(),
+                    TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
+                    TimeElapsedColumn(),
+                    TimeRemainingColumn(),
+                    transient=True,
+                    refresh_per_second=10,
+                    console=console,
+                    disable=not console.is_terminal,
+                ) as progress:
+                    task = progress.add_task("Checking variations • Found: 0", total=total_variations)
+                    # Advance the bar in batches; found hits flush immediately with the counter update
+                    advance_batch = max(1, total_variations // 1000)
+                    unflushed = 0
+                    # Bound once for the per-result helper below
+                    write_jsonl = jsonl_writer.write if jsonl_writer is not None else None
+                    found_append = self.found_accounts.append
+                    update = progress.update
+
+                    def handle_results(idx: int, number: str, results: Dict) -> bool:
+                        """Stream, record and announce one number's results. Returns False if the user stops."""
+                        nonlocal auto_continue_enabled, unflushed
                         for platform, structured in results.items():
-                            # Stream all results if requested
-                            if self.jsonl_out:
-                                rh.append_jsonl(self.jsonl_out, structured)
-                            if structured.status == "found":
-                                account = {
-                                    'number': number,
-                                    'platform': platform,
-                                    'status': structured.status,
-                                    'details': structured.details,
-                                    'timestamp': structured.ts,
-                                    'index': idx,
-                                }
-                                self.found_accounts.append(account)
-                                self.found_count += 1
-                                # If we're pausing on found and auto-continue isn't enabled yet, prompt; else only update counter
-                                if pause_on_found and not auto_continue_enabled:
-                                    progress.console.print(Panel.fit(
-                                        f"[bold green]Found[/] [white]{account['number']}[/] on [cyan]{account['platform']}[/]",
-                                        border_style="green"
-                                    ))
-                                    choice = self.ui.get_pause_choice()
-                                    if choice == 'stop':
-                                        progress.update(task, advance=1)
-                                        return self.found_accounts, i
-                                    elif choice == 'auto':
-                                        auto_continue_enabled = True
-                                        progress.console.print("Auto-continue [green]enabled[/]")
-                                # Always reflect the new-found counter in the task description without printing a new line
-                                progress.update(task, description=f"Checking variations • Found: {self.found_count}")
-                    except Exception as e:
-                        progress.console.print(f"\n  [red]Error[/] checking {number}: {e}")
-                    finally:
-                        if i < total_variations and self.timeout > 0:
-                            time.sleep(self.timeout)
-                        progress.update(task, advance=1)
-
-            return self.found_accounts, len(work_items)
+                            if write_jsonl is not None:
+                                write_jsonl(structured)
+                            if structured.status != "found":
+                                continue
+                            account = FoundAccount(
+                                number=number,
+                                platform=platform,
+                                status=structured.status,
+                                details=structured.details,
+                                timestamp=structured.ts,
+                                index=idx,
+                            )
+                            found_append(account)
+                            self.found_count += 1
+                            # If we're pausing on found and auto-continue isn't enabled yet, prompt; else only update counter
+                            if pause_on_found and not auto_continue_enabled:
+                                cached = " [dim](cached)[/]" if account.details.get('cached') else ""
+                                progress.console.print(_boxed(
+                                    f"[bold green]Found[/] [white]{account.number}[/] on [cyan]{account.platform}[/]{cached}",
+                                    border_style="green"
+                                ))
+                                choice = self.ui.get_pause_choice()
+                                if choice == 'stop':
+                                    return False
+                                elif choice == 'auto':
+                                    auto_continue_enabled = True
+                                    progress.console.print("Auto-continue [green]enabled[/]")
+                            # Always reflect the new-found counter in the task description without printing a new line
+                            update(task, advance=unflushed, description=f"Checking variations • Found: {self.found_count}")
+                            unflushed = 0
+                        return True
+
+                    for _ in range(window):
+                        if not submit_next():
+                            break
+                    # Results are consumed on the main thread, so prompting and progress stay single-threaded
+                    while pending:
+                        done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                        # Handle finished futures in submission order (pending is insertion-ordered)
+                        for future in [f for f in pending if f in done]:
+                            idx, number = pending.pop(future)
+                            i += 1
+                            try:
+                                if not handle_results(idx, number, future.result()):
+                                    return self.found_accounts, i
+                            except Exception as e:
+                                progress.console.print(f"\n  [red]Error[/] checking {number}: {e}")
+                            finally:
+                                unflushed += 1
+                                if unflushed >= advance_batch:
+                                    update(task, advance=unflushed)
+                                    unflushed = 0
+                            submit_next()
+                    if unflushed:
+                        progress.update(task, advance=unflushed)
+
+                return self.found_accounts, i
 
         except KeyboardInterrupt:
             console.print(f"\n\n{ERROR_MESSAGES['interrupted']}")
-            return self.found_accounts, i if 'i' in locals() else 0
-        finally:
-            # Restore previous logging disable threshold
-            try:
-                logging.disable(prev_disabled)
-            except Exception:
-                logging.disable(logging.NOTSET)
+            return self.found_accounts, i
 
 
 def setup_logging(verbose: bool = False):
@@ -289,44 +468,50 @@ def setup_logging(verbose: bool = False):
         logging.getLogger(name).setLevel(logging.WARNING if not verbose else logging.DEBUG)
 
 
-def validate_args(args) -> bool:
-    """Validate command line arguments."""
+def validate_args(args) -> Optional[List[str]]:
+    """Validate command line arguments.
+    Returns the selected services that recommend proxies, or None if validation fails.
+    """
     if not validate_pattern(args.number):
         print(ERROR_MESSAGES['invalid_pattern'])
-        return False
+        return None
     
     if args.timeout is not None:
         if args.timeout < 0:
             print("Timeout must be non-negative")
-            return False
+            return None
     
     if args.max_variations <= 0:
         print("Max variations must be positive")
-        return False
+        return None
     
     if args.start < 0:
         print("Start position must be non-negative")
-        return False
+        return None
     
     # Validate threads
     if hasattr(args, 'threads') and args.threads is not None:
         if args.threads < 1:
             print("Threads must be a positive integer")
-            return False
+            return None
+    
+    if args.max_retries < 0:
+        print("Max retries must be non-negative")
+        return None
     
     # Validate services
     if args.services:
         validated_services = validate_services(args.services)
         if not validated_services:
             print("Error: No valid services specified")
-            return False
+            return None
         args.services = validated_services
     else:
         # Default to all registered services
         from tessera_2600.services import SERVICE_REGISTRY
         args.services = list(SERVICE_REGISTRY.keys())
     
-    return True
+    return _proxy_recommended(args.services)
 
 
 def main():
@@ -339,7 +524,7 @@ def main():
     
     # Handle information-only flags
     if args.show_services:
-        svc_list = validate_services(args.services) if args.services else list(SERVICE_CONFIGURATIONS.keys())
+        svc_list = validate_services(args.services) if args.services else list(_service_table())
         ConsoleUI.print_service_info(svc_list)
         # Show any duplicate descriptor warnings
         try:
@@ -353,8 +538,20 @@ def main():
         return 0
     
     if args.show_rate_limits:
-        _print_rate_limit_table(args.services if args.services else list(SERVICE_CONFIGURATIONS.keys()))
+        _print_rate_limit_table(args.services if args.services else list(_service_table()))
         return 0
+
+    if args.clear_cache:
+        try:
+            cache = ResponseCache()
+            cache.clear()
+            cache.close()
+            console.print(f"🧹 Cleared response cache at {cache.path}")
+        except Exception as e:
+            console.print(f"[red]Failed to clear response cache:[/] {e}")
+            return 1
+        if not args.number:
+            return 0
     
     # Cross-reference mode (no scanning)
     if args.cross_ref:
@@ -371,10 +568,11 @@ def main():
     
     # Require --number for actual execution
     if not args.number:
-        parser.error("--number is required (unless using --show-services, --show-rate-limits, or --cross-ref)")
+        parser.error("--number is required (unless using --show-services, --show-rate-limits, --clear-cache, or --cross-ref)")
     
     # Validate arguments
-    if not validate_args(args):
+    proxy_recommended = validate_args(args)
+    if proxy_recommended is None:
         return 1
     
     # Compute dynamic timeout if not provided
@@ -435,41 +633,29 @@ def main():
                 console.print(f"⚠️  No proxies loaded from {args.proxy_file}")
         
         # Check if proxies are needed
-        proxy_recommended = [s for s in args.services 
-                             if SERVICE_CONFIGURATIONS[s].get('proxy_recommended', SERVICE_CONFIGURATIONS[s].get('requires_proxy', False))]
         if proxy_recommended and not proxies:
             console.print(f"⚠️  Services with proxies recommended: {', '.join(proxy_recommended)}")
             console.print("   Consider using --proxy-file for better success rates\n")
         
-        # Generate work items
-        work_items, start_index = variation_gen.generate_variations(
+        # Generate work items lazily; the count is known without expanding the pattern
+        work_iter, total_work = variation_gen.iter_variations(
             args.number, args.max_variations, args.use_country_prefixes, args.start
         )
-        if not work_items:
+        first_item = next(work_iter, None)
+        if first_item is None:
             console.print("[red]No variations to process.[/]")
             return 1
+        work_items = chain((first_item,), work_iter)
         
         # Confirm large operations
-        if len(work_items) > CONFIRMATION_THRESHOLD:
-            from tessera_2600.config import get_recommended_timeout_for_services
+        if total_work > CONFIRMATION_THRESHOLD:
             from tessera_2600.utils import format_duration
-            n = len(work_items)
+            n = total_work
             svc_count = max(1, len(args.services))
             total_http = n * svc_count
 
-            # Estimate bounds
-            rec_delay = get_recommended_timeout_for_services(args.services)
-            # Optimistic: very fast endpoints like Seznam can be ~50–70 ms per variation when timeout is 0
-            optimistic_per_var = max(0.05, float(args.timeout)) if args.timeout is not None else 0.05
-            # If we know services have non-zero recommended delay, use it as conservative bound
-            if rec_delay and rec_delay > 0:
-                conservative_per_var = float(rec_delay)
-            else:
-                # Otherwise assume a small per-service overhead (≈60 ms each)
-                conservative_per_var = max(optimistic_per_var, 0.06 * svc_count)
-
-            est_low = n * optimistic_per_var
-            est_high = n * conservative_per_var
+            # Estimate bounds depend only on the service set, count and timeout
+            est_low, est_high = _estimate(frozenset(args.services), n, args.timeout)
             est_range = f"~{format_duration(int(est_low))}–{format_duration(int(est_high))}"
 
             message = (
@@ -482,35 +668,22 @@ def main():
                 console.print("Operation cancelled")
                 return 0
         
-        # Initialize and run checker (threaded or sequential)
-        if threads and threads > 1:
-            from tessera_2600.operations.checker_coordinator import CheckerCoordinator
-            coordinator = CheckerCoordinator(
-                services=args.services,
-                proxies=proxies,
-                timeout=args.timeout,
-                display_manager=None,
-            )
-            found_accounts, total_checked = coordinator.run_checks(
-                work_items=work_items,
-                threads=threads,
-                start_index=start_index,
-                pause_on_found=not args.no_pause,
-                auto_continue=args.auto_continue,
-                ui=ui,
-            )
-        else:
-            checker = CLIChecker(
-                services=args.services,
-                proxies=proxies,
-                timeout=args.timeout,
-                jsonl_out=args.jsonl_out
-            )
-            found_accounts, total_checked = checker.run_checks(
-                work_items=work_items,
-                pause_on_found=not args.no_pause,
-                auto_continue=args.auto_continue
-            )
+        # Initialize and run checker; threads only widen the pool, pacing stays per service
+        checker = CLIChecker(
+            services=args.services,
+            proxies=proxies,
+            timeout=args.timeout,
+            jsonl_out=args.jsonl_out,
+            threads=threads,
+            use_cache=not args.no_cache,
+            max_retries=args.max_retries,
+        )
+        found_accounts, total_checked = checker.run_checks(
+            work_items=work_items,
+            pause_on_found=not args.no_pause,
+            auto_continue=args.auto_continue,
+            total=total_work,
+        )
         
         # Show summary
         elapsed_time = int(time.time() - start_time)
@@ -612,10 +785,13 @@ Examples:
     parser.add_argument("--proxy-file", help="File containing proxy list")
     parser.add_argument("--timeout", type=int, default=None, help="Timeout between requests in seconds (default: auto based on selected services)")
     parser.add_argument("--threads", "-t", type=int, default=None, help="Number of worker threads (default: auto based on selected services; 1 = sequential)")
+    parser.add_argument("--max-retries", type=int, default=MAX_RETRIES, help=f"Retry a check on the next proxy after connection errors/timeouts (default: {MAX_RETRIES})")
     parser.add_argument("--max-variations", type=int, default=DEFAULT_MAX_VARIATIONS, help=f"Maximum variations to generate (default: {DEFAULT_MAX_VARIATIONS:,})")
     parser.add_argument("--verbose", "-v", action="store_true", help="Enable verbose logging")
     parser.add_argument("--output", "-o", help="Save aggregated found results to JSON/CSV/TXT file (inferred by extension)")
     parser.add_argument("--jsonl-out", help="Stream all per-check results to a JSONL file for durability")
+    parser.add_argument("--no-cache", action="store_true", help="Don't read or write the persistent response cache")
+    parser.add_argument("--clear-cache", action="store_true", help="Clear the persistent response cache (exits unless --number is given)")
     parser.add_argument("--no-pause", action="store_true", help="Don't pause when accounts are found")
     parser.add_argument("--auto-continue", action="store_true", help="Auto-continue on found accounts")
     parser.add_argument("--no-banner", action="store_true", help="Don't show application banner")
@@ -646,16 +822,16 @@ def _print_rate_limit_table(services: List[str]):
     table.add_column("Risk")
     table.add_column("Notes", overflow="fold")
     for service in services:
-        cfg = SERVICE_CONFIGURATIONS.get(service)
-        if not cfg:
+        row = _service_table().get(service)
+        if row is None:
             continue
         table.add_row(
-            cfg['name'],
-            str(cfg.get('recommended_delay', '')),
-            str(cfg.get('max_requests_per_minute', '')),
-            ("Recommended" if cfg.get('proxy_recommended', cfg.get('requires_proxy', False)) else "Optional"),
-            (cfg.get('rate_limit_severity') or 'unknown').capitalize(),
-            cfg.get('description', ''),
+            row.name,
+            str(row.delay),
+            str(row.max_rpm),
+            "Recommended" if row.proxy_rec else "Optional",
+            row.severity,
+            row.description,
         )
     console.print(table)
 
@@ -1,10 +1,52 @@
 import logging
+import re
+import sys
 import time
-from typing import List, Dict
+from itertools import islice
+from typing import Iterable, List, Dict
 from tessera_2600.config import PHONE_PATTERN
+from tessera_2600.core.models import FoundAccount
+
+# Console key polling for timed waits on Windows, where select() only works on sockets
+_IS_WINDOWS = sys.platform == 'win32'
+try:
+    import msvcrt
+except ImportError:
+    msvcrt = None
 
 logger = logging.getLogger(__name__)
 
+# Central regex from tessera_2600.config, compiled once to keep validation consistent
+_PHONE_RE = re.compile(PHONE_PATTERN, re.IGNORECASE)
+
+# http(s)://[user:pass@]host:port[/path]; host may be a bracketed IPv6 literal
+_PROXY_RE = re.compile(
+    r'^https?://(?:[^@/\s]+@)?(?:\[[0-9A-Fa-f:.]+\]|[^:/@\s\[\]]+):\d+(?:/\S*)?$'
+)
+
+# get_pause_choice answers; anything else (including empty) means 'continue'
+_CHOICE_MAP = {
+    's': 'stop', 'stop': 'stop',
+    'a': 'auto', 'auto': 'auto',
+    'r': 'recent', 'recent': 'recent',
+}
+
+# Separator line used by headers and summaries
+_BAR = "=" * 60
+_BAR_LINE = _BAR + "\n"
+
+# Suffix marking truncated text in truncate_string
+_ELLIPSIS = "..."
+_ELLIPSIS_LEN = len(_ELLIPSIS)
+
+# log_message level name -> logger method; unknown levels fall back to INFO
+_LEVEL_FUNCS = {
+    "ERROR": logger.error,
+    "WARNING": logger.warning,
+    "DEBUG": logger.debug,
+    "INFO": logger.info,
+}
+
 def validate_phone_number(phone_number: str) -> bool:
     """
     Validate phone number format.
@@ -15,15 +57,27 @@ def validate_phone_number(phone_number: str) -> bool:
     Returns:
         bool: True if valid format, False otherwise
     """
-    import re
-    # Use central regex from tessera_2600.config to ensure consistency. Validate whole string.
-    is_valid = bool(re.fullmatch(PHONE_PATTERN, phone_number, re.IGNORECASE))
+    # Validate the whole string
+    is_valid = _PHONE_RE.fullmatch(phone_number) is not None
     
     if not is_valid:
-        logger.debug(f"Invalid phone number format: {phone_number}")
+        logger.debug("Invalid phone number format: %s", phone_number)
     
     return is_valid
 
+def validate_phone_number_batch(phone_numbers: Iterable[str]) -> List[bool]:
+    """
+    Validate many phone numbers at once.
+    
+    Args:
+        phone_numbers: Phone number strings to validate
+        
+    Returns:
+        List[bool]: Validity of each number, in input order
+    """
+    fullmatch = _PHONE_RE.fullmatch
+    return [fullmatch(number) is not None for number in phone_numbers]
+
 def format_phone_number(phone_number: str) -> str:
     """
     Format phone number for display.
@@ -36,6 +90,35 @@ def format_phone_number(phone_number: str) -> str:
     """
     return phone_number.strip()
 
+class ProgressLogFilter(logging.Filter):
+    """
+    Hide records below a level on the root handlers while a live progress display runs.
+    
+    Unlike logging.disable(), this leaves the process-wide disable threshold and logger
+    levels untouched, and detach() removes exactly what attach() added.
+    """
+    
+    def __init__(self, level: int = logging.WARNING):
+        super().__init__()
+        self.level = level
+        self._handlers: List[logging.Handler] = []
+    
+    def filter(self, record: logging.LogRecord) -> bool:
+        return record.levelno >= self.level
+    
+    def attach(self) -> "ProgressLogFilter":
+        """Add this filter to the current root handlers."""
+        self._handlers = list(logging.getLogger().handlers)
+        for handler in self._handlers:
+            handler.addFilter(self)
+        return self
+    
+    def detach(self) -> None:
+        """Remove this filter from the handlers it was attached to (no-op if not attached)."""
+        for handler in self._handlers:
+            handler.removeFilter(self)
+        self._handlers = []
+
 def log_message(message: str, level: str = "INFO"):
     """
     Log a message with the specified level.
@@ -44,15 +127,7 @@ def log_message(message: str, level: str = "INFO"):
         message: Message to log
         level: Log level (INFO, WARNING, ERROR, DEBUG)
     """
-    level = level.upper()
-    if level == "ERROR":
-        logger.error(message)
-    elif level == "WARNING":
-        logger.warning(message)
-    elif level == "DEBUG":
-        logger.debug(message)
-    else:
-        logger.info(message)
+    _LEVEL_FUNCS.get(level.upper(), logger.info)(message)
 
 def load_proxies(proxy_file: str) -> List[str]:
     """
@@ -66,24 +141,28 @@ def load_proxies(proxy_file: str) -> List[str]:
     """
     proxies = []
     try:
-        with open(proxy_file, 'r') as f:
-            for line_num, line in enumerate(f, 1):
-                line = line.strip()
-                
-                # Skip empty lines and comments
-                if not line or line.startswith('#'):
-                    continue
-                
-                # Add protocol if not present
-                if not line.startswith(('http://', 'https://')):
-                    line = f"http://{line}"
-                
-                # Basic validation
-                if '://' in line and ':' in line.split('://', 1)[1]:
-                    proxies.append(line)
-                    logger.debug(f"Loaded proxy: {line}")
-                else:
-                    logger.warning(f"Invalid proxy format on line {line_num}: {line}")
+        debug = logger.isEnabledFor(logging.DEBUG)
+        # One bulk read; splitlines() then splits in C instead of iterating the file object
+        with open(proxy_file, 'r', encoding='utf-8', errors='replace') as f:
+            data = f.read()
+        
+        for line_num, line in enumerate(data.splitlines(), 1):
+            line = line.strip()
+            
+            # Skip empty lines and comments
+            if not line or line[0] == '#':
+                continue
+            
+            # Add protocol if not present
+            if not line.startswith(('http://', 'https://')):
+                line = f"http://{line}"
+            
+            if _PROXY_RE.match(line):
+                proxies.append(line)
+                if debug:
+                    logger.debug("Loaded proxy: %s", line)
+            else:
+                logger.warning("Invalid proxy format on line %d: %s", line_num, line)
         
         logger.info(f"Successfully loaded {len(proxies)} proxies from {proxy_file}")
         return proxies
@@ -107,14 +186,25 @@ def sleep_with_message(seconds: int):
     """
     if seconds <= 0:
         return
-        
+    
+    # Nobody is watching a countdown when output is redirected; sleep once
+    if not sys.stdout.isatty():
+        time.sleep(seconds)
+        return
+    
+    # Refresh the countdown at most ~20 times regardless of the wait length
+    step = max(1, seconds // 20)
+    clear_line = "\r" + " " * 30 + "\r"
+    remaining = seconds
     try:
-        for i in range(seconds, 0, -1):
-            print(f"\rWaiting {i} seconds...", end='', flush=True)
-            time.sleep(1)
-        print("\r" + " " * 20 + "\r", end='', flush=True)  # Clear the line
+        while remaining > 0:
+            print(f"\rWaiting {remaining} seconds...", end='', flush=True)
+            chunk = min(step, remaining)
+            time.sleep(chunk)
+            remaining -= chunk
+        print(clear_line, end='', flush=True)
     except KeyboardInterrupt:
-        print("\r" + " " * 20 + "\r", end='', flush=True)  # Clear the line
+        print(clear_line, end='', flush=True)
         raise
 
 def confirm_action(message: str, default: bool = False) -> bool:
@@ -152,16 +242,12 @@ def format_duration(seconds: int) -> str:
     Returns:
         str: Formatted duration string
     """
+    seconds = int(seconds)
     if seconds < 60:
         return f"{seconds}s"
-    elif seconds < 3600:
-        minutes = seconds // 60
-        remaining_seconds = seconds % 60
-        return f"{minutes}m {remaining_seconds}s"
-    else:
-        hours = seconds // 3600
-        remaining_minutes = (seconds % 3600) // 60
-        return f"{hours}h {remaining_minutes}m"
+    hours, rem = divmod(seconds, 3600)
+    minutes, secs = divmod(rem, 60)
+    return f"{hours}h {minutes}m" if hours else f"{minutes}m {secs}s"
 
 def calculate_estimated_time(total_items: int, timeout: int, threads: int = 1) -> str:
     """
@@ -175,30 +261,15 @@ def calculate_estimated_time(total_items: int, timeout: int, threads: int = 1) -
     Returns:
         str: Estimated time string
     """
-    # Base processing time per request (network request + processing overhead)
-    base_processing_time = 2.0  # seconds
+    # Each request costs the timeout plus ~2s of network/processing overhead
+    per_item = timeout + 2.0
     
     if threads <= 1:
-        # Sequential processing: timeout + processing time for each item
-        estimated_seconds = total_items * (timeout + base_processing_time)
+        estimated_seconds = total_items * per_item
     else:
-        # Threaded processing calculation
-        # Each thread processes items in parallel, but still needs to respect timeout
-        items_per_thread = total_items / threads
-        
-        # Time for one thread to complete its portion
-        # In threading, the timeout still applies but work is distributed
-        time_per_thread = items_per_thread * (timeout + base_processing_time)
-        
-        # Add some overhead for thread coordination and resource contention
-        thread_overhead = 1.2  # 20% overhead for coordination
-        
-        # The total time is roughly the time for the slowest thread
-        estimated_seconds = time_per_thread * thread_overhead
-        
-        # Add a small constant overhead for thread startup/shutdown
-        startup_overhead = min(30, threads * 2)  # Max 30 seconds, or 2 seconds per thread
-        estimated_seconds += startup_overhead
+        # Work is split across threads, plus 20% coordination overhead and
+        # a startup/shutdown allowance of 2s per thread (max 30s)
+        estimated_seconds = total_items * per_item / threads * 1.2 + min(30, threads * 2)
     
     return format_duration(int(estimated_seconds))
 
@@ -215,7 +286,7 @@ def truncate_string(text: str, max_length: int = 50) -> str:
     """
     if len(text) <= max_length:
         return text
-    return text[:max_length - 3] + "..."
+    return text[:max_length - _ELLIPSIS_LEN] + _ELLIPSIS
 
 def print_separator(char: str = "=", length: int = 60):
     """
@@ -225,7 +296,7 @@ def print_separator(char: str = "=", length: int = 60):
         char: Character to use for separator
         length: Length of separator
     """
-    print(char * length)
+    sys.stdout.write(_BAR_LINE if char == "=" and length == 60 else char * length + "\n")
 
 def print_header(title: str):
     """
@@ -234,9 +305,7 @@ def print_header(title: str):
     Args:
         title: Header title
     """
-    print_separator()
-    print(f" {title}")
-    print_separator()
+    sys.stdout.write(f"{_BAR_LINE} {title}\n{_BAR_LINE}")
 
 def wait_for_user_input(message: str = "Press Enter to continue", timeout: int = None) -> bool:
     """
@@ -250,7 +319,6 @@ def wait_for_user_input(message: str = "Press Enter to continue", timeout: int =
         bool: True if user pressed Enter, False if timeout or interrupted
     """
     import select
-    import sys
     
     print(f"\nPause: {message}...")
     
@@ -259,20 +327,33 @@ def wait_for_user_input(message: str = "Press Enter to continue", timeout: int =
             # Wait indefinitely for user input
             input()
             return True
-        else:
-            # Wait with timeout (Unix/Linux only)
-            if hasattr(select, 'select'):
-                ready, _, _ = select.select([sys.stdin], [], [], timeout)
-                if ready:
-                    input()
-                    return True
-                else:
-                    print(f"\nTimeout after {timeout}s, continuing automatically...")
-                    return False
-            else:
-                # Fallback for Windows - just wait for input
+        elif _IS_WINDOWS and msvcrt is not None:
+            # Poll the console until Enter is pressed or the timeout expires
+            deadline = time.monotonic() + timeout
+            while time.monotonic() < deadline:
+                while msvcrt.kbhit():
+                    ch = msvcrt.getwch()
+                    if ch == '\x03':
+                        raise KeyboardInterrupt
+                    if ch in ('\r', '\n'):
+                        print()
+                        return True
+                time.sleep(0.05)
+            print(f"\nTimeout after {timeout}s, continuing automatically...")
+            return False
+        elif hasattr(select, 'select'):
+            # Wait with timeout on POSIX terminals
+            ready, _, _ = select.select([sys.stdin], [], [], timeout)
+            if ready:
                 input()
                 return True
+            else:
+                print(f"\nTimeout after {timeout}s, continuing automatically...")
+                return False
+        else:
+            # No way to poll stdin - just wait for input
+            input()
+            return True
                 
     except KeyboardInterrupt:
         print("\nInterrupted by user")
@@ -293,14 +374,19 @@ def pause_on_found(found_result: str, phone_number: str, platform: str, auto_con
     Returns:
         bool: True to continue, False to stop
     """
+    # Without a terminal nobody can answer the prompt: report the hit on one plain line and continue
+    if not sys.stdout.isatty():
+        sys.stdout.write(f"ACCOUNT FOUND: {phone_number} | {platform} | {found_result}\n")
+        return True
+    
     from tessera_2600.config import SUCCESS_MESSAGES
     
-    print(f"\n{'='*60}")
+    print(f"\n{_BAR}")
     print(f"ACCOUNT FOUND!")
     print(f"Phone: {phone_number}")
     print(f"Platform: {platform}")
     print(f"Details: {found_result}")
-    print(f"{'='*60}")
+    print(_BAR)
     
     if auto_continue:
         print(f"{SUCCESS_MESSAGES['auto_continuing']}")
@@ -345,15 +431,7 @@ def get_pause_choice() -> str:
         print("  [r] Show recent found accounts")
         
         response = input("Choice: ").strip().lower()
-        
-        if response == 's' or response == 'stop':
-            return 'stop'
-        elif response == 'a' or response == 'auto':
-            return 'auto'
-        elif response == 'r' or response == 'recent':
-            return 'recent'
-        else:  # Default to continue on any other input (including empty)
-            return 'continue'
+        return _CHOICE_MAP.get(response, 'continue')
             
     except KeyboardInterrupt:
         print("\nInterrupted by user")
@@ -361,12 +439,12 @@ def get_pause_choice() -> str:
     except EOFError:
         return 'continue'
 
-def show_found_summary(found_accounts: List[Dict], current_index: int, total_variations: int):
+def show_found_summary(found_accounts: List[FoundAccount], current_index: int, total_variations: int):
     """
     Show a summary of recently found accounts.
     
     Args:
-        found_accounts: List of found account dictionaries
+        found_accounts: Found accounts collected so far, oldest first
         current_index: Current processing index
         total_variations: Total number of variations
     """
@@ -374,25 +452,31 @@ def show_found_summary(found_accounts: List[Dict], current_index: int, total_var
         print("\nNo accounts found yet.")
         return
     
-    print(f"\n{'='*60}")
+    print(f"\n{_BAR}")
     print(f"FOUND ACCOUNTS SUMMARY ({len(found_accounts)} total)")
-    print(f"{'='*60}")
+    print(_BAR)
     print(f"Progress: {current_index}/{total_variations} variations checked")
     print()
     
     # Show last 10 found accounts (most recent first)
-    recent_accounts = found_accounts[-10:]
-    for i, account in enumerate(reversed(recent_accounts), 1):
-        time_ago = int(time.time() - account.get('timestamp', 0))
+    now = time.time()
+    for i, account in enumerate(islice(reversed(found_accounts), 10), 1):
+        # Cached answers are as old as their original check, not the lookup
+        cached = account.details.get('cached')
+        checked_at = account.details.get('checked_at') if cached else None
+        time_ago = int(now - (checked_at or account.timestamp or 0))
         time_str = format_duration(time_ago) if time_ago > 0 else "just now"
-        worker_info = f" by worker {account.get('worker_id', '?')}" if 'worker_id' in account else ""
+        worker_id = account.worker_id
+        worker_info = f" by worker {worker_id}" if worker_id is not None else ""
         
-        print(f"  {i:2d}. {account['number']}")
-        print(f"      {account['platform']}: {account['result']}")
-        print(f"      Found {time_str} ago (variation #{account.get('index', '?')}){worker_info}")
+        print(f"  {i:2d}. {account.number}")
+        # Show the service's own result string, not just the status
+        detail = account.details.get('raw') or account.status
+        print(f"      {account.platform}: {detail}")
+        print(f"      Found {time_str} ago{' (cached)' if cached else ''} (variation #{account.index}){worker_info}")
         print()
     
     if len(found_accounts) > 10:
         print(f"   ... and {len(found_accounts) - 10} more")
     
-    print(f"{'='*60}")
\ No newline at end of file
+    print(_BAR)
\ No newline at end of file
@@ -0,0 +1,84 @@
+import os
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import unittest
+from unittest.mock import patch
+
+from tessera_2600.checker import SocialMediaChecker
+from tessera_2600.core.declarative_service import DeclarativeService
+from tessera_2600.tessera_cli import CLIChecker
+
+
+def _work(count):
+    return [(i, f'+42073123456{i}') for i in range(count)]
+
+
+class TestCLIChecker(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        env = patch.dict(os.environ, {'XDG_CACHE_HOME': self.tmp.name})
+        env.start()
+        self.addCleanup(env.stop)
+        self.addCleanup(self.tmp.cleanup)
+
+    @patch.object(DeclarativeService, 'check_phone_number', return_value='[NOT FOUND] mocked')
+    def test_threaded_runs_use_the_response_cache(self, mock_check):
+        for _ in range(2):
+            checker = CLIChecker(['seznamcz'], [], 0, threads=4)
+            found, checked = checker.run_checks(_work(6), pause_on_found=False, auto_continue=True)
+            self.assertEqual((found, checked), ([], 6))
+        # The second run is answered entirely from the cache
+        self.assertEqual(mock_check.call_count, 6)
+
+    @patch.object(DeclarativeService, 'check_phone_number', return_value='[NOT FOUND] mocked')
+    def test_threaded_runs_pass_every_proxy_and_max_retries(self, _mock_check):
+        proxies = ['http://127.0.0.1:8080', 'http://127.0.0.1:8081']
+        created = []
+
+        def build(**kwargs):
+            created.append(SocialMediaChecker(**kwargs))
+            return created[-1]
+
+        with patch('tessera_2600.tessera_cli.SocialMediaChecker', side_effect=build):
+            checker = CLIChecker(['seznamcz'], proxies, 0, threads=4, use_cache=False, max_retries=2)
+            checker.run_checks(_work(3), pause_on_found=False, auto_continue=True)
+        service = created[0].services['seznamcz']
+        self.assertEqual(service.proxy_list, proxies)
+        self.assertEqual(service.max_retries, 2)
+
+    @patch.object(DeclarativeService, 'check_phone_number', return_value='[FOUND] mocked')
+    def test_stop_on_found_skips_requests_waiting_for_a_slot(self, mock_check):
+        checker = CLIChecker(['seznamcz'], [], 2, threads=4, use_cache=False)
+        start = time.monotonic()
+        with patch.object(checker.ui, 'get_pause_choice', return_value='stop'):
+            found, checked = checker.run_checks(_work(8), pause_on_found=True, auto_continue=False)
+        self.assertLess(time.monotonic() - start, 1.5)
+        self.assertEqual((len(found), checked), (1, 1))
+        # Workers booked for later slots were woken and never reached the service
+        self.assertEqual(mock_check.call_count, 1)
+
+    def test_setup_failure_closes_jsonl_writer(self):
+        path = os.path.join(self.tmp.name, 'checks.jsonl')
+        checker = CLIChecker(['seznamcz'], [], 0, jsonl_out=path, use_cache=False)
+        with patch('tessera_2600.tessera_cli.SocialMediaChecker', side_effect=RuntimeError('boom')):
+            with self.assertRaises(RuntimeError):
+                checker.run_checks(_work(1), pause_on_found=False, auto_continue=True)
+        self.assertFalse(any(t.name == 'jsonl-writer' for t in threading.enumerate()))
+
+
+class TestCLIImport(unittest.TestCase):
+    def test_import_does_not_load_service_descriptors(self):
+        code = (
+            "import tessera_2600.tessera_cli, tessera_2600.services as services; "
+            "print(services._LOADED)"
+        )
+        env = dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path))
+        out = subprocess.run([sys.executable, '-c', code], env=env, capture_output=True, text=True, check=True)
+        self.assertEqual(out.stdout.strip(), 'False')
+
+
+if __name__ == '__main__':
+    unittest.main()
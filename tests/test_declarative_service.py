@@ -1,8 +1,10 @@
 import unittest
 from unittest.mock import patch
 
+import requests
+
 from tessera_2600.core.descriptor_models import from_dict
-from tessera_2600.core.declarative_service import DeclarativeService
+from tessera_2600.core.declarative_service import DeclarativeService, create_session
 
 
 class DummyResponse:
@@ -56,6 +58,63 @@ class TestDeclarativeService(unittest.TestCase):
         result = svc.check_phone_number("+420 731 234 567")
         self.assertIn("[NOT FOUND]", result)
 
+    @patch("requests.Session.request")
+    def test_connection_error_fails_over_to_next_proxy(self, mock_request):
+        mock_request.side_effect = [
+            requests.exceptions.ConnectionError("dead proxy"),
+            DummyResponse(status_code=200, json_obj={"ok": True}),
+        ]
+        svc = DeclarativeService(self.descriptor, proxy_list=["http://p1:8080", "http://p2:8080"])
+        result = svc.check_phone_number("+420 731 234 567")
+        self.assertIn("[FOUND]", result)
+        used = [call.kwargs["proxies"]["https"] for call in mock_request.call_args_list]
+        self.assertEqual(used, ["http://p1:8080", "http://p2:8080"])
+
+    @patch("requests.Session.request")
+    def test_connection_error_without_rotation_is_reported(self, mock_request):
+        mock_request.side_effect = requests.exceptions.ConnectionError("down")
+        svc = DeclarativeService(self.descriptor)
+        self.assertEqual(svc.check_phone_number("+420 731 234 567"), "[ERROR]: Connection failed")
+        self.assertEqual(mock_request.call_count, 1)
+
+    def test_signals_parse_json_and_match_regex(self):
+        descriptor = from_dict({
+            "schema_version": 1,
+            "service_key": "dummy",
+            "display_name": "Dummy",
+            "endpoints": [{
+                "name": "check",
+                "method": "GET",
+                "url": "https://example.com/check",
+                "success_signals": [
+                    {"type": "json_path", "path": "$.exists", "equals": True, "weight": 0.7},
+                    {"type": "regex", "pattern": "user_[0-9]+", "weight": 0.5},
+                ],
+                "failure_signals": [
+                    {"type": "status", "equals": 404, "weight": 0.1},
+                ],
+            }],
+        })
+        svc = DeclarativeService(descriptor)
+        ep = descriptor.endpoints[0]
+        resp = DummyResponse(status_code=200, text='{"exists": true, "id": "user_42"}', json_obj={"exists": True})
+        self.assertAlmostEqual(svc._evaluate_signals(ep, resp), 120.0)
+        resp = DummyResponse(status_code=404, text="nope")
+        self.assertAlmostEqual(svc._evaluate_signals(ep, resp), -10.0)
+
+    def test_create_session_sizes_connection_pool(self):
+        svc = DeclarativeService(self.descriptor, session=create_session(pool_size=16))
+        adapter = svc.session.get_adapter("https://example.com/")
+        self.assertEqual(adapter._pool_maxsize, 16)
+
+    def test_services_reuse_a_shared_session(self):
+        session = create_session(pool_size=4)
+        first = DeclarativeService(self.descriptor, session=session)
+        second = DeclarativeService(self.descriptor, session=session)
+        self.assertIs(first.session, session)
+        self.assertIs(second.session, session)
+        self.assertEqual(session.headers["Connection"], "keep-alive")
+
 
 if __name__ == "__main__":
     unittest.main()
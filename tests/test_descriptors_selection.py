@@ -14,7 +14,9 @@ class TestDescriptorSelection(unittest.TestCase):
 
         src = services.get_descriptor_source("seznamcz")
         self.assertIsNotNone(src)
-        self.assertEqual(src.get("selected_file"), "seznamcz.json")
+        self.assertEqual(src.selected_file, "seznamcz.json")
+        self.assertEqual(src.to_dict()["selected_file"], "seznamcz.json")
+        self.assertTrue(any(p.endswith("seznamcz.yaml") for p in src.candidates))
 
         # Duplicate warnings should mention the service base name when both files exist
         dups = services.get_duplicate_warnings()
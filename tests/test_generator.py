@@ -1,6 +1,6 @@
 import unittest
 
-from tessera_2600.generator import validate_pattern, expand_phone_number
+from tessera_2600.generator import validate_pattern, expand_phone_number, iter_phone_numbers, PhoneNumberGenerator
 from tessera_2600.config import MAX_WILDCARDS
 
 
@@ -15,12 +15,29 @@ class TestGenerator(unittest.TestCase):
         pattern = "+420 " + ("x" * (MAX_WILDCARDS + 1))
         self.assertFalse(validate_pattern(pattern))
 
+    def test_validate_pattern_counts_upper_and_lower_wildcards(self):
+        self.assertTrue(validate_pattern("+420 731X4x748"))
+        pattern = "+420 " + "xX" * MAX_WILDCARDS
+        self.assertFalse(validate_pattern(pattern))
+
     def test_expand_phone_number_basic(self):
         out = expand_phone_number("+1 23x", use_country_prefixes=False)
         self.assertEqual(len(out), 10)
         self.assertIn("+1 230", out)
         self.assertIn("+1 239", out)
 
+    def test_iter_phone_numbers_matches_expansion(self):
+        for pattern, prefixes in (("+420 7x1 (x)4-x48", False), ("+420 xx1 234 x4x", True)):
+            numbers, total = iter_phone_numbers(pattern, prefixes)
+            expected = expand_phone_number(pattern, prefixes)
+            self.assertEqual(total, len(expected))
+            self.assertEqual(list(numbers), expected)
+
+    def test_parse_strips_separators(self):
+        gen = PhoneNumberGenerator("+420 (731) x4-x748")
+        self.assertEqual(gen.country_code, "420")
+        self.assertEqual(gen.base_number, "731x4x748")
+
 
 if __name__ == '__main__':
     unittest.main()
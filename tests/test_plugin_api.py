@@ -31,6 +31,9 @@ class TestPluginAPI(unittest.TestCase):
         self.assertIsInstance(svc, DeclarativeService)
         self.assertEqual(svc.service_name, 'Seznam.cz')
 
+    def test_validate_phones(self):
+        self.assertEqual(plugin_api.validate_phones(['+420 731 234 567', '731 234 567']), [True, False])
+
     @patch.object(DeclarativeService, 'check_phone_number', return_value='[NOT FOUND] mocked')
     def test_check_phone_and_iter_check(self, _mock_method):
         # Single check
@@ -0,0 +1,35 @@
+import threading
+import time
+import unittest
+
+from tessera_2600.core.rate_limiter import RateLimiter
+
+
+class TestRateLimiter(unittest.TestCase):
+    def test_spaces_requests_per_key(self):
+        limiter = RateLimiter({'slow': 0.05})
+        start = time.monotonic()
+        for _ in range(3):
+            limiter.acquire('slow')
+        self.assertGreaterEqual(time.monotonic() - start, 0.1)
+
+    def test_keys_are_independent_and_zero_interval_is_free(self):
+        limiter = RateLimiter({'a': 10.0})
+        self.assertEqual(limiter.acquire('a'), 0.0)
+        # Unknown keys fall back to the default interval (0 -> no pacing)
+        self.assertEqual(limiter.acquire('b'), 0.0)
+        self.assertEqual(limiter.acquire('b'), 0.0)
+
+    def test_cancel_wakes_waiting_workers(self):
+        limiter = RateLimiter({'slow': 10.0})
+        limiter.acquire('slow')
+        threading.Timer(0.05, limiter.cancel).start()
+        start = time.monotonic()
+        limiter.acquire('slow')
+        self.assertLess(time.monotonic() - start, 5.0)
+        # Once cancelled, acquire() no longer waits at all
+        self.assertEqual(limiter.acquire('slow'), 0.0)
+
+
+if __name__ == '__main__':
+    unittest.main()
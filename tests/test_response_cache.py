@@ -0,0 +1,84 @@
+import os
+import sqlite3
+import tempfile
+import time
+import unittest
+
+from tessera_2600.core.models import CheckResult
+from tessera_2600.core.response_cache import ResponseCache
+
+
+def _result(phone, status='found'):
+    return CheckResult(service='Seznam.cz', phone=phone, status=status, details={'ok': True}, ts=1.0)
+
+
+class TestResponseCache(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, 'cache', 'responses.db')
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_roundtrip_normalizes_number_formatting(self):
+        cache = ResponseCache(self.path)
+        cache.set('seznamcz', _result('+420731234567'))
+        hit = cache.get('seznamcz', '+420 731 234 567')
+        self.assertIsNotNone(hit)
+        self.assertEqual((hit.service, hit.status), ('Seznam.cz', 'found'))
+        # Hits are marked as cached and keep the time of the original check
+        self.assertEqual(hit.details, {'ok': True, 'cached': True, 'checked_at': 1.0})
+        self.assertGreater(hit.ts, 1.0)
+        self.assertEqual(hit.phone, '+420 731 234 567')
+        self.assertIsNone(cache.get('instagram', '+420731234567'))
+        cache.close()
+
+        # Entries survive reopening
+        reopened = ResponseCache(self.path)
+        self.assertIsNotNone(reopened.get('seznamcz', '+420731234567'))
+        reopened.clear()
+        self.assertEqual(len(reopened), 0)
+        reopened.close()
+
+    def test_transient_statuses_are_not_cached(self):
+        cache = ResponseCache(self.path)
+        cache.set('seznamcz', _result('+420731234567', status='rate_limited'))
+        cache.set('seznamcz', _result('+420731234568', status='error'))
+        self.assertEqual(len(cache), 0)
+        cache.close()
+
+    def test_expired_entries_are_misses(self):
+        cache = ResponseCache(self.path, ttl=0.01)
+        cache.set('seznamcz', _result('+420731234567'))
+        time.sleep(0.02)
+        self.assertIsNone(cache.get('seznamcz', '+420731234567'))
+        cache.close()
+
+    def test_cleanup_evicts_least_recently_used(self):
+        cache = ResponseCache(self.path, max_size=2)
+        for phone in ('+420731234561', '+420731234562', '+420731234563'):
+            cache.set('seznamcz', _result(phone))
+            time.sleep(0.001)
+        cache.get('seznamcz', '+420731234561')
+        cache.cleanup()
+        self.assertEqual(len(cache), 2)
+        self.assertIsNone(cache.get('seznamcz', '+420731234562'))
+        self.assertIsNotNone(cache.get('seznamcz', '+420731234561'))
+        cache.close()
+
+    def test_writes_are_committed_in_batches(self):
+        cache = ResponseCache(self.path)
+        self.assertEqual(cache._conn.execute("PRAGMA journal_mode").fetchone()[0], 'wal')
+        cache.set('seznamcz', _result('+420731234567'))
+        other = sqlite3.connect(self.path)
+        try:
+            # Not visible to other connections until the batch is flushed
+            self.assertEqual(other.execute("SELECT COUNT(*) FROM responses").fetchone()[0], 0)
+            cache.close()
+            self.assertEqual(other.execute("SELECT COUNT(*) FROM responses").fetchone()[0], 1)
+        finally:
+            other.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,106 @@
+import json
+import os
+import tempfile
+import time
+import unittest
+
+from tessera_2600.core.models import CheckResult, FoundAccount
+from tessera_2600.operations.results_handler import ResultsHandler, JsonlWriter
+
+
+class TestResultsHandler(unittest.TestCase):
+    def setUp(self):
+        self.rh = ResultsHandler()
+
+    def test_merge_results_skips_existing_and_repeated_accounts(self):
+        existing = {
+            'timestamp': 1.0,
+            'total_found': 1,
+            'accounts': [{'number': '+420731234567', 'platform': 'Seznam.cz'}],
+        }
+        new_accounts = [
+            {'number': '+420731234567', 'platform': 'Seznam.cz'},
+            {'number': '+420731234568', 'platform': 'Seznam.cz'},
+            {'number': '+420731234568', 'platform': 'Seznam.cz'},
+            {'number': '+420731234567', 'platform': 'Instagram'},
+        ]
+        merged = self.rh._merge_results(existing, new_accounts)
+        self.assertEqual(merged['total_found'], 3)
+        self.assertEqual(merged['merge_info']['new_accounts_added'], 2)
+        self.assertEqual(merged['merge_info']['duplicates_skipped'], 2)
+        self.assertEqual(
+            [(a['number'], a['platform']) for a in merged['accounts']],
+            [('+420731234567', 'Seznam.cz'), ('+420731234568', 'Seznam.cz'), ('+420731234567', 'Instagram')],
+        )
+
+    def test_generate_new_filename_skips_taken_suffixes(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            original = os.path.join(tmp, 'results.json')
+            for name in ('results.json', 'results_1.json', 'results_2.json'):
+                open(os.path.join(tmp, name), 'w').close()
+            self.assertEqual(self.rh._generate_new_filename(original), os.path.join(tmp, 'results_3.json'))
+
+    def test_append_jsonl_appends_records(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'runs', 'checks.jsonl')
+            for phone in ('+420731234567', '+420731234568'):
+                self.rh.append_jsonl(path, CheckResult(service='Seznam.cz', phone=phone, status='not_found', details={}))
+            with open(path, encoding='utf-8') as f:
+                lines = [json.loads(line) for line in f]
+        self.assertEqual([r['phone'] for r in lines], ['+420731234567', '+420731234568'])
+        self.assertEqual(lines[0]['status'], 'not_found')
+
+    def test_jsonl_writer_flushes_in_order_on_close(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'runs', 'bg.jsonl')
+            writer = JsonlWriter(path, maxsize=2)
+            phones = ['+42073123456%d' % i for i in range(10)]
+            for phone in phones:
+                writer.write(CheckResult(service='Seznam.cz', phone=phone, status='not_found', details={}))
+            # Records reach the file once the writer catches up, before close()
+            deadline = time.monotonic() + 5
+            while time.monotonic() < deadline:
+                with open(path, encoding='utf-8') as f:
+                    if len(f.readlines()) == len(phones):
+                        break
+                time.sleep(0.01)
+            else:
+                self.fail('records were not flushed before close()')
+            writer.close()
+            writer.close()  # idempotent
+            with open(path, encoding='utf-8') as f:
+                lines = [json.loads(line) for line in f]
+        self.assertEqual([r['phone'] for r in lines], phones)
+
+    def test_per_service_results_accept_found_accounts(self):
+        accounts = [
+            FoundAccount(number='+420731234567', platform='Seznam.cz', status='found', details={}, timestamp=1.0, index=1),
+            FoundAccount(number='+420731234568', platform='Instagram', status='found', details={}, timestamp=2.0, index=2, worker_id=3),
+        ]
+        with tempfile.TemporaryDirectory() as tmp:
+            written = self.rh.save_per_service_results(accounts, tmp)
+            with open(written['Instagram'], encoding='utf-8') as f:
+                data = json.load(f)
+        self.assertEqual(sorted(written), ['Instagram', 'Seznam.cz'])
+        self.assertEqual(data['accounts'][0]['worker_id'], 3)
+        self.assertNotIn('worker_id', accounts[0].to_dict())
+
+    def test_write_csv_rows_follow_header_order(self):
+        accounts = [
+            {'number': '+420731234567', 'platform': 'Seznam.cz', 'status': 'found', 'timestamp': 1.5, 'index': 3},
+            {'number': '+420731234568', 'platform': 'Instagram', 'result': '[FOUND]', 'index': 4},
+        ]
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'out.csv')
+            self.rh._write_csv(path, accounts)
+            with open(path, encoding='utf-8') as f:
+                lines = f.read().splitlines()
+        self.assertEqual(lines, [
+            'number,platform,status,timestamp,index',
+            '+420731234567,Seznam.cz,found,1.5,3',
+            '+420731234568,Instagram,[FOUND],,4',
+        ])
+
+
+if __name__ == '__main__':
+    unittest.main()
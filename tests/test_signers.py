@@ -0,0 +1,25 @@
+import json
+import unittest
+import urllib.parse
+
+from tessera_2600.services.signers import instagram
+
+
+class TestInstagramSigner(unittest.TestCase):
+    def test_quote_table_matches_quote_plus(self):
+        data = bytes(range(256)) + '{"q": "+420 731/é~"}'.encode('utf-8')
+        self.assertEqual(instagram._quote_plus_bytes(data), urllib.parse.quote_plus(data))
+
+    def test_signed_body_round_trips_payload(self):
+        body = {"source": "default", "q": "${phone}", "ig_sig_key_version": "4"}
+        headers, query, new_body = instagram.ig_sig_v4({}, {}, body, {"phone": "+420 731 234 567"})
+        self.assertTrue(new_body.startswith("ig_sig_key_version=4&signed_body="))
+        signed = new_body.split("signed_body=", 1)[1]
+        _signature, quoted = signed.split(".", 1)
+        payload = json.loads(urllib.parse.unquote_plus(quoted))
+        self.assertEqual(payload["q"], "+420731234567")
+        self.assertIn("application/x-www-form-urlencoded", headers["Content-Type"])
+
+
+if __name__ == '__main__':
+    unittest.main()